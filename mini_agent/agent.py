@@ -6,10 +6,9 @@ from pathlib import Path
 from time import perf_counter
 from typing import Optional
 
-import tiktoken
-
 from .llm import LLMClient
 from .logger import AgentLogger
+from .retry import RetryExhaustedError
 from .schema import Message
 from .tools.base import Tool, ToolResult
 from .utils import calculate_display_width
@@ -126,6 +125,9 @@ class Agent:
         Uses cl100k_base encoder (GPT-4/Claude/M2 compatible)
         """
         try:
+            # Imported lazily so startup does not pay for tiktoken until tokens are counted
+            import tiktoken
+
             # Use cl100k_base encoder (used by GPT-4 and most modern models)
             encoding = tiktoken.get_encoding("cl100k_base")
         except Exception:
@@ -372,8 +374,6 @@ Requirements:
                 response = await self.llm.generate(messages=self.messages, tools=tool_list)
             except Exception as e:
                 # Check if it's a retry exhausted error
-                from .retry import RetryExhaustedError
-
                 if isinstance(e, RetryExhaustedError):
                     error_msg = f"LLM call failed after {e.attempts} retries\nLast error: {str(e.last_exception)}"
                     print(f"\n{Colors.BRIGHT_RED}❌ Retry failed:{Colors.RESET} {error_msg}")
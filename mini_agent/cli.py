@@ -16,6 +16,7 @@ import platform
 import subprocess
 import sys
 import threading
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
 from typing import List
@@ -32,7 +33,7 @@ from mini_agent.agent import Agent
 from mini_agent.config import Config
 from mini_agent.schema import LLMProvider
 from mini_agent.tools.base import Tool
-from mini_agent.tools.bash_tool import BashKillTool, BashOutputTool, BashTool
+from mini_agent.tools.bash_tool import BackgroundShellManager, BashKillTool, BashOutputTool, BashTool
 from mini_agent.tools.file_tools import EditTool, ReadTool, WriteTool
 from mini_agent.tools.mcp_loader import cleanup_mcp_connections, load_mcp_tools_async, set_mcp_timeout_config
 from mini_agent.tools.note_tool import SessionNoteTool
@@ -264,10 +265,11 @@ def print_stats(agent: Agent, session_start: datetime):
     hours, remainder = divmod(int(duration.total_seconds()), 3600)
     minutes, seconds = divmod(remainder, 60)
 
-    # Count different types of messages
-    user_msgs = sum(1 for m in agent.messages if m.role == "user")
-    assistant_msgs = sum(1 for m in agent.messages if m.role == "assistant")
-    tool_msgs = sum(1 for m in agent.messages if m.role == "tool")
+    # Count different types of messages in a single pass over the history
+    role_counts = Counter(m.role for m in agent.messages)
+    user_msgs = role_counts["user"]
+    assistant_msgs = role_counts["assistant"]
+    tool_msgs = role_counts["tool"]
 
     print(f"\n{Colors.BOLD}{Colors.BRIGHT_CYAN}Session Statistics:{Colors.RESET}")
     print(f"{Colors.DIM}{'─' * 40}{Colors.RESET}")
@@ -388,7 +390,8 @@ async def initialize_base_tools(config: Config):
                         skills_dir = str(path.resolve())
                         break
 
-            skill_tools, skill_loader = create_skill_tools(skills_dir)
+            skill_cache = Path.home() / ".mini-agent" / "cache" / "skills.json"
+            skill_tools, skill_loader = create_skill_tools(skills_dir, cache_file=str(skill_cache))
             if skill_tools:
                 tools.extend(skill_tools)
                 print(f"{Colors.GREEN}✅ Loaded Skill tool (get_skill){Colors.RESET}")
@@ -468,15 +471,20 @@ def add_workspace_tools(tools: List[Tool], config: Config, workspace_dir: Path):
 
 
 async def _quiet_cleanup():
-    """Clean up MCP connections, suppressing noisy asyncgen teardown tracebacks."""
+    """Stop background shells and clean up MCP connections, suppressing noisy asyncgen teardown tracebacks."""
     # Silence the asyncgen finalization noise that anyio/mcp emits when
     # stdio_client's task group is torn down across tasks.  The handler is
     # intentionally NOT restored: asyncgen finalization happens during
     # asyncio.run() shutdown (after run_agent returns), so restoring the
     # handler here would still let the noise through.  Since this runs
     # right before process exit, swallowing late exceptions is safe.
-    loop = asyncio.get_event_loop()
+    loop = asyncio.get_running_loop()
     loop.set_exception_handler(lambda _loop, _ctx: None)
+    # Background commands run in their own session and would otherwise outlive the agent
+    try:
+        await BackgroundShellManager.terminate_all()
+    except Exception:
+        pass
     try:
         await cleanup_mcp_connections()
     except Exception:
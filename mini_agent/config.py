@@ -5,9 +5,10 @@ Provides unified configuration loading and management functionality
 
 from pathlib import Path
 
-import yaml
 from pydantic import BaseModel, Field
 
+from .utils import safe_load_yaml
+
 
 class RetryConfig(BaseModel):
     """Retry configuration"""
@@ -98,7 +99,7 @@ class Config(BaseModel):
             raise FileNotFoundError(f"Configuration file does not exist: {config_path}")
 
         with open(config_path, encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+            data = safe_load_yaml(f)
 
         if not data:
             raise ValueError("Configuration file is empty")
@@ -2,6 +2,7 @@
 
 import json
 import logging
+from functools import partial
 from typing import Any
 
 from openai import AsyncOpenAI
@@ -12,6 +13,9 @@ from .base import LLMClientBase
 
 logger = logging.getLogger(__name__)
 
+# Compact encoder for tool-call arguments replayed to the API on every turn
+_json_dumps = partial(json.dumps, separators=(",", ":"), ensure_ascii=False)
+
 
 class OpenAIClient(LLMClientBase):
     """LLM client using OpenAI's protocol.
@@ -151,7 +155,7 @@ class OpenAIClient(LLMClientBase):
                                 "type": "function",
                                 "function": {
                                     "name": tool_call.function.name,
-                                    "arguments": json.dumps(tool_call.function.arguments),
+                                    "arguments": _json_dumps(tool_call.function.arguments),
                                 },
                             }
                         )
@@ -3,9 +3,10 @@
 Provides decorators and utility functions to support retry logic for async functions.
 
 Features:
-- Supports exponential backoff strategy
+- Supports exponential backoff strategy with random jitter
 - Configurable retry count and intervals
 - Supports specifying retryable exception types
+- Skips retries for permanent API errors (4xx responses)
 - Detailed logging
 - Fully decoupled, non-invasive to business code
 """
@@ -13,12 +14,35 @@ Features:
 import asyncio
 import functools
 import logging
+import random
 from typing import Any, Callable, Type, TypeVar
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+# 4xx statuses that can succeed on a later attempt (timeout, conflict, rate limit)
+_RETRYABLE_CLIENT_STATUS = frozenset({408, 409, 429})
+
+
+def is_retryable_error(exception: Exception) -> bool:
+    """Check whether retrying could help with this error
+
+    API errors carrying a 4xx status (bad request, auth, not found, ...) fail the
+    same way every time, so they are not retried. Everything else (timeouts,
+    connection errors, 5xx responses) is treated as transient.
+
+    Args:
+        exception: The raised exception
+
+    Returns:
+        True if the call should be retried
+    """
+    status = getattr(exception, "status_code", None)
+    if isinstance(status, int) and 400 <= status < 500:
+        return status in _RETRYABLE_CLIENT_STATUS
+    return True
+
 
 class RetryConfig:
     """Retry configuration class"""
@@ -31,6 +55,7 @@ class RetryConfig:
         max_delay: float = 60.0,
         exponential_base: float = 2.0,
         retryable_exceptions: tuple[Type[Exception], ...] = (Exception,),
+        jitter: float = 0.1,
     ):
         """
         Args:
@@ -40,6 +65,8 @@ class RetryConfig:
             max_delay: Maximum delay time (seconds)
             exponential_base: Exponential backoff base
             retryable_exceptions: Tuple of retryable exception types
+            jitter: Extra random delay as a fraction of the backoff delay, so that
+                concurrent clients hitting the same failure do not retry in lockstep
         """
         self.enabled = enabled
         self.max_retries = max_retries
@@ -47,6 +74,7 @@ class RetryConfig:
         self.max_delay = max_delay
         self.exponential_base = exponential_base
         self.retryable_exceptions = retryable_exceptions
+        self.jitter = jitter
 
     def calculate_delay(self, attempt: int) -> float:
         """Calculate delay time (exponential backoff)
@@ -107,13 +135,19 @@ def async_retry(
                 except config.retryable_exceptions as e:
                     last_exception = e
 
+                    # Permanent errors (e.g. invalid API key) fail the same way on every attempt
+                    if not is_retryable_error(e):
+                        logger.error(f"Function {func.__name__} failed with non-retryable error: {str(e)}")
+                        raise
+
                     # If this is the last attempt, don't retry
                     if attempt >= config.max_retries:
                         logger.error(f"Function {func.__name__} retry failed, reached maximum retry count {config.max_retries}")
                         raise RetryExhaustedError(e, attempt + 1)
 
-                    # Calculate delay time
+                    # Calculate delay time, spread out by jitter but still capped at max_delay
                     delay = config.calculate_delay(attempt)
+                    delay = min(delay + random.uniform(0, delay * config.jitter), config.max_delay)
 
                     # Log
                     logger.warning(
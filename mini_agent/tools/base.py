@@ -36,20 +36,26 @@ class Tool:
         raise NotImplementedError
 
     def to_schema(self) -> dict[str, Any]:
-        """Convert tool to Anthropic tool schema."""
-        return {
-            "name": self.name,
-            "description": self.description,
-            "input_schema": self.parameters,
-        }
-
-    def to_openai_schema(self) -> dict[str, Any]:
-        """Convert tool to OpenAI tool schema."""
-        return {
-            "type": "function",
-            "function": {
+        """Convert tool to Anthropic tool schema (built once per tool instance)."""
+        schema = self.__dict__.get("_anthropic_schema")
+        if schema is None:
+            schema = self._anthropic_schema = {
                 "name": self.name,
                 "description": self.description,
-                "parameters": self.parameters,
-            },
-        }
+                "input_schema": self.parameters,
+            }
+        return schema
+
+    def to_openai_schema(self) -> dict[str, Any]:
+        """Convert tool to OpenAI tool schema (built once per tool instance)."""
+        schema = self.__dict__.get("_openai_schema")
+        if schema is None:
+            schema = self._openai_schema = {
+                "type": "function",
+                "function": {
+                    "name": self.name,
+                    "description": self.description,
+                    "parameters": self.parameters,
+                },
+            }
+        return schema
@@ -4,16 +4,191 @@ Supports both bash (Unix/Linux/macOS) and PowerShell (Windows).
 """
 
 import asyncio
+import os
 import platform
 import re
+import shlex
+import shutil
+import signal
+import subprocess
+import sys
 import time
 import uuid
+from collections import deque
+from itertools import islice
 from typing import Any
 
 from pydantic import Field, model_validator
 
 from .base import Tool, ToolResult
 
+# Characters that need bash to interpret them (pipes, redirects, expansion, quoting, ...)
+_SHELL_METACHARS = re.compile(r"[|&;<>()$`\\\"'*?\[\]{}~#!\n]")
+
+# Builtins that must run inside a shell to have any effect
+_SHELL_BUILTINS = frozenset(
+    {".", "alias", "cd", "eval", "exec", "exit", "export", "read", "set", "source", "trap", "ulimit", "umask", "unset", "wait"}
+)
+
+
+def _split_simple_command(command: str) -> list[str] | None:
+    """Split a command that can be executed directly, without a shell.
+
+    Returns:
+        The argv list, or None if the command needs shell features
+        (metacharacters, builtins, env assignments, programs not on PATH).
+    """
+    if _SHELL_METACHARS.search(command):
+        return None
+    argv = shlex.split(command)
+    if not argv or argv[0] in _SHELL_BUILTINS:
+        return None
+    # Relative program paths resolve against the workspace, not our cwd
+    if "/" in argv[0] and not argv[0].startswith("/"):
+        return None
+    if shutil.which(argv[0]) is None:
+        return None
+    return argv
+
+
+# asyncio.timeout() (3.11+) cancels in place instead of wrapping the awaitable in a new Task
+_HAS_ASYNCIO_TIMEOUT = sys.version_info >= (3, 11)
+
+# Spawn off the event loop only where process exit can be awaited without a thread (Linux pidfd)
+_OFFLOAD_SPAWN = hasattr(os, "pidfd_open")
+
+# Foreground output cap (stdout + stderr); the command is killed once it is exceeded
+_MAX_OUTPUT_BYTES = 10 * 1024 * 1024
+_READ_CHUNK_SIZE = 64 * 1024
+# How long a killed command's leftover output is drained before its pipes are closed
+_DISCARD_GRACE_SECONDS = 0.5
+
+# Commands run in their own session, so on POSIX the whole process group can be signalled
+_USE_PROCESS_GROUPS = hasattr(os, "killpg")
+
+
+def _signal_process_tree(process, force: bool = False) -> None:
+    """Terminate (or kill, if force) a spawned command together with the children it started.
+
+    Both spawn paths start commands in a new session, so the command's pid is also its
+    process group id; signalling the group reaches pipeline members and other
+    grandchildren that would otherwise keep the output pipes open.
+    """
+    try:
+        if _USE_PROCESS_GROUPS:
+            os.killpg(process.pid, signal.SIGKILL if force else signal.SIGTERM)
+        elif force:
+            process.kill()
+        else:
+            process.terminate()
+    except ProcessLookupError:
+        pass
+
+
+def _kill_abandoned_spawn(spawn: "asyncio.Future[subprocess.Popen]") -> None:
+    """Kill and reap a child whose spawn finished after the caller was cancelled."""
+    if spawn.cancelled() or spawn.exception() is not None:
+        return
+    popen = spawn.result()
+    _signal_process_tree(popen, force=True)
+    for pipe in (popen.stdout, popen.stderr):
+        if pipe is not None:
+            pipe.close()
+    # Reap off the loop; the child is already dying
+    asyncio.get_running_loop().run_in_executor(None, popen.wait)
+
+# Lines kept per background shell; older unread lines are dropped first
+_MAX_BACKGROUND_LINES = 10_000
+
+
+class _OffloadedProcess:
+    """Minimal asyncio.subprocess.Process look-alike around a Popen created in a worker thread.
+
+    asyncio spawns children with a synchronous Popen on the event loop thread, which
+    blocks every other coroutine until the child has exec'd. Spawning in the default
+    executor keeps the loop responsive; pipes are attached back to the loop afterwards.
+    """
+
+    def __init__(self, popen: subprocess.Popen):
+        self._popen = popen
+        self.pid = popen.pid
+        self.returncode: int | None = None
+        self.stdout: asyncio.StreamReader | None = None
+        self.stderr: asyncio.StreamReader | None = None
+        self._transports: list[asyncio.BaseTransport] = []
+        # Reap the child as soon as it exits, like asyncio's child watcher does
+        self._exited = asyncio.get_running_loop().create_task(self._watch_exit())
+
+    @classmethod
+    async def create(cls, args: str | list[str], shell: bool, stderr: int, cwd: str | None) -> "_OffloadedProcess":
+        """Spawn the process in a worker thread and connect its pipes to the running loop."""
+        loop = asyncio.get_running_loop()
+        spawn = loop.run_in_executor(
+            None,
+            lambda: subprocess.Popen(
+                args, shell=shell, stdout=subprocess.PIPE, stderr=stderr, cwd=cwd, start_new_session=True
+            ),
+        )
+        try:
+            popen = await asyncio.shield(spawn)
+        except asyncio.CancelledError:
+            # The worker thread still finishes the spawn; kill the child as soon as it exists
+            spawn.add_done_callback(_kill_abandoned_spawn)
+            raise
+
+        process = cls(popen)
+        try:
+            process.stdout = await process._connect(popen.stdout)
+            if popen.stderr is not None:
+                process.stderr = await process._connect(popen.stderr)
+        except BaseException:
+            _signal_process_tree(process, force=True)
+            process.close()
+            raise
+        return process
+
+    async def _connect(self, pipe) -> asyncio.StreamReader:
+        loop = asyncio.get_running_loop()
+        reader = asyncio.StreamReader(loop=loop)
+        transport, _ = await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader, loop=loop), pipe)
+        self._transports.append(transport)
+        return reader
+
+    def close(self) -> None:
+        """Close the pipe transports without waiting for EOF, like SubprocessTransport.close()."""
+        for transport in self._transports:
+            transport.close()
+
+    def terminate(self) -> None:
+        self._popen.terminate()
+
+    def kill(self) -> None:
+        self._popen.kill()
+
+    async def _watch_exit(self) -> int:
+        """Wait for the process to exit without blocking the loop or a thread."""
+        try:
+            pidfd = os.pidfd_open(self.pid)
+        except OSError:
+            # Kernel without pidfd support: fall back to polling
+            while self._popen.poll() is None:
+                await asyncio.sleep(0.01)
+        else:
+            loop = asyncio.get_running_loop()
+            exited = loop.create_future()
+            loop.add_reader(pidfd, lambda: exited.done() or exited.set_result(None))
+            try:
+                await exited
+            finally:
+                loop.remove_reader(pidfd)
+                os.close(pidfd)
+        self.returncode = self._popen.wait()
+        return self.returncode
+
+    async def wait(self) -> int:
+        """Wait for the process to exit and return its exit code."""
+        return await asyncio.shield(self._exited)
+
 
 class BashOutputResult(ToolResult):
     """Bash command execution result with separated stdout and stderr.
@@ -32,20 +207,16 @@ class BashOutputResult(ToolResult):
     @model_validator(mode="after")
     def format_content(self) -> "BashOutputResult":
         """Auto-format content from stdout and stderr if content is empty."""
-        output = ""
-        if self.stdout:
-            output += self.stdout
+        # Collect the sections and join once; stdout can be megabytes, so avoid re-copying it per +=
+        parts = [self.stdout] if self.stdout else []
         if self.stderr:
-            output += f"\n[stderr]:\n{self.stderr}"
+            parts.append(f"\n[stderr]:\n{self.stderr}")
         if self.bash_id:
-            output += f"\n[bash_id]:\n{self.bash_id}"
+            parts.append(f"\n[bash_id]:\n{self.bash_id}")
         if self.exit_code:
-            output += f"\n[exit_code]:\n{self.exit_code}"
-
-        if not output:
-            output = "(no output)"
+            parts.append(f"\n[exit_code]:\n{self.exit_code}")
 
-        self.content = output
+        self.content = "".join(parts) or "(no output)"
         return self
 
 
@@ -61,7 +232,8 @@ class BackgroundShell:
         self.command = command
         self.process = process
         self.start_time = start_time
-        self.output_lines: list[str] = []
+        self.output_lines: deque[str] = deque(maxlen=_MAX_BACKGROUND_LINES)
+        self.total_lines = 0
         self.last_read_index = 0
         self.status = "running"
         self.exit_code: int | None = None
@@ -69,11 +241,15 @@ class BackgroundShell:
     def add_output(self, line: str):
         """Add new output line."""
         self.output_lines.append(line)
+        self.total_lines += 1
 
     def get_new_output(self, filter_pattern: str | None = None) -> list[str]:
         """Get new output since last check, optionally filtered by regex."""
-        new_lines = self.output_lines[self.last_read_index :]
-        self.last_read_index = len(self.output_lines)
+        unread = self.total_lines - self.last_read_index
+        kept = min(unread, len(self.output_lines))
+        dropped = unread - kept
+        new_lines = list(islice(self.output_lines, len(self.output_lines) - kept, None))
+        self.last_read_index = self.total_lines
 
         if filter_pattern:
             try:
@@ -83,6 +259,8 @@ class BackgroundShell:
                 # Invalid regex, return all lines
                 pass
 
+        if dropped:
+            new_lines.insert(0, f"[... {dropped} earlier lines discarded ...]")
         return new_lines
 
     def update_status(self, is_alive: bool, exit_code: int | None = None):
@@ -96,11 +274,11 @@ class BackgroundShell:
     async def terminate(self):
         """Terminate the background process."""
         if self.process.returncode is None:
-            self.process.terminate()
+            _signal_process_tree(self.process)
             try:
                 await asyncio.wait_for(self.process.wait(), timeout=5)
             except asyncio.TimeoutError:
-                self.process.kill()
+                _signal_process_tree(self.process, force=True)
         self.status = "terminated"
         self.exit_code = self.process.returncode
 
@@ -213,6 +391,116 @@ class BackgroundShellManager:
 
         return shell
 
+    @classmethod
+    async def terminate_all(cls) -> None:
+        """Terminate every background shell, e.g. when the agent exits.
+
+        Commands run in their own session, so they do not receive the terminal's
+        SIGINT/SIGHUP and would otherwise outlive the agent.
+        """
+        await asyncio.gather(*(cls.terminate(bash_id) for bash_id in list(cls._shells)), return_exceptions=True)
+
+
+async def _read_capped_output(
+    process, max_bytes: int, stdout_chunks: list[bytes], stderr_chunks: list[bytes]
+) -> bool:
+    """Read stdout and stderr into chunk lists until EOF, then wait for the process.
+
+    Once more than max_bytes have arrived in total, the command's process tree is killed
+    and both streams stop collecting; they are still read to EOF so the pipes close.
+    The chunks read so far stay in the lists if the read is cancelled (e.g. on timeout).
+
+    Args:
+        process: Process with piped stdout and stderr
+        max_bytes: Maximum combined number of bytes to keep
+        stdout_chunks: List that receives stdout chunks
+        stderr_chunks: List that receives stderr chunks
+
+    Returns:
+        True if the output was truncated
+    """
+    received = 0
+    truncated = False
+
+    async def drain(stream: asyncio.StreamReader | None, chunks: list[bytes]) -> None:
+        nonlocal received, truncated
+        if stream is None:
+            return
+        while chunk := await stream.read(_READ_CHUNK_SIZE):
+            if truncated:
+                # Discard whatever the dying process tree still had buffered
+                continue
+            room = max_bytes - received
+            if len(chunk) > room:
+                chunks.append(chunk[:room])
+                received = max_bytes
+                truncated = True
+                _signal_process_tree(process, force=True)
+            else:
+                chunks.append(chunk)
+                received += len(chunk)
+
+    await asyncio.gather(drain(process.stdout, stdout_chunks), drain(process.stderr, stderr_chunks))
+    await process.wait()
+    return truncated
+
+
+def _close_pipes(process) -> None:
+    """Close a process's output pipes without waiting for EOF."""
+    if isinstance(process, _OffloadedProcess):
+        process.close()
+    else:
+        # asyncio.subprocess.Process has no public close(); its transport owns the pipes
+        process._transport.close()
+
+
+async def _discard_output(process) -> None:
+    """Read a killed process's remaining output so its pipes close, then reap it.
+
+    A grandchild that left the process group (e.g. via setsid) can keep the pipes open
+    long after the kill, so reading gives up after a short grace period and the pipes
+    are closed instead.
+    """
+
+    async def drain() -> None:
+        for stream in (process.stdout, process.stderr):
+            if stream is not None:
+                while await stream.read(_READ_CHUNK_SIZE):
+                    pass
+
+    try:
+        await asyncio.wait_for(drain(), timeout=_DISCARD_GRACE_SECONDS)
+    except asyncio.TimeoutError:
+        _close_pipes(process)
+    await process.wait()
+
+
+def _build_bash_parameters(shell_name: str) -> dict[str, Any]:
+    """Build the BashTool parameter schema for the given shell."""
+    cmd_desc = f"The {shell_name} command to execute. Quote file paths with spaces using double quotes."
+    return {
+        "type": "object",
+        "properties": {
+            "command": {
+                "type": "string",
+                "description": cmd_desc,
+            },
+            "timeout": {
+                "type": "integer",
+                "description": "Optional: Timeout in seconds (default: 120, max: 600). Only applies to foreground commands.",
+                "default": 120,
+                "minimum": 1,
+                "maximum": 600,
+            },
+            "run_in_background": {
+                "type": "boolean",
+                "description": "Optional: Set to true to run the command in the background. Use this for long-running commands like servers. You can monitor output using bash_output tool.",
+                "default": False,
+            },
+        },
+        "required": ["command"],
+    }
+
 
 class BashTool(Tool):
     """Execute shell commands in foreground or background.
@@ -222,26 +510,12 @@ class BashTool(Tool):
     - Unix/Linux/macOS: bash
     """
 
-    def __init__(self, workspace_dir: str | None = None):
-        """Initialize BashTool with OS-specific shell detection.
-
-        Args:
-            workspace_dir: Working directory for command execution.
-                           If provided, all commands run in this directory.
-                           If None, commands run in the process's cwd.
-        """
-        self.is_windows = platform.system() == "Windows"
-        self.shell_name = "PowerShell" if self.is_windows else "bash"
-        self.workspace_dir = workspace_dir
+    name = "bash"
 
-    @property
-    def name(self) -> str:
-        return "bash"
-
-    @property
-    def description(self) -> str:
-        shell_examples = {
-            "Windows": """Execute PowerShell commands in foreground or background.
+    # Metadata depends only on the shell, so build it once per shell kind
+    # instead of on every schema request.
+    _DESCRIPTIONS = {
+        "PowerShell": """Execute PowerShell commands in foreground or background.
 
 For terminal operations like git, npm, docker, etc. DO NOT use for file operations - use specialized tools.
 
@@ -260,7 +534,7 @@ Examples:
   - git status
   - npm test
   - python -m http.server 8080 (with run_in_background=true)""",
-            "Unix": """Execute bash commands in foreground or background.
+        "bash": """Execute bash commands in foreground or background.
 
 For terminal operations like git, npm, docker, etc. DO NOT use for file operations - use specialized tools.
 
@@ -274,37 +548,76 @@ Tips:
   - Chain dependent commands with &&: git add . && git commit -m "msg"
   - Use absolute paths instead of cd when possible
   - For background commands, monitor with bash_output and terminate with bash_kill
+  - Simple commands (no quotes, pipes, redirects, globs or variables) run directly without a shell wrapper
 
 Examples:
   - git status
   - npm test
   - python3 -m http.server 8080 (with run_in_background=true)""",
-        }
-        return shell_examples["Windows"] if self.is_windows else shell_examples["Unix"]
+    }
+    _PARAMETERS = {shell: _build_bash_parameters(shell) for shell in ("PowerShell", "bash")}
+
+    def __init__(self, workspace_dir: str | None = None):
+        """Initialize BashTool with OS-specific shell detection.
+
+        Args:
+            workspace_dir: Working directory for command execution.
+                           If provided, all commands run in this directory.
+                           If None, commands run in the process's cwd.
+        """
+        self.is_windows = platform.system() == "Windows"
+        self.shell_name = "PowerShell" if self.is_windows else "bash"
+        self.workspace_dir = workspace_dir
+
+    @property
+    def description(self) -> str:
+        return self._DESCRIPTIONS[self.shell_name]
 
     @property
     def parameters(self) -> dict[str, Any]:
-        cmd_desc = f"The {self.shell_name} command to execute. Quote file paths with spaces using double quotes."
-        return {
-            "type": "object",
-            "properties": {
-                "command": {
-                    "type": "string",
-                    "description": cmd_desc,
-                },
-                "timeout": {
-                    "type": "integer",
-                    "description": "Optional: Timeout in seconds (default: 120, max: 600). Only applies to foreground commands.",
-                    "default": 120,
-                },
-                "run_in_background": {
-                    "type": "boolean",
-                    "description": "Optional: Set to true to run the command in the background. Use this for long-running commands like servers. You can monitor output using bash_output tool.",
-                    "default": False,
-                },
-            },
-            "required": ["command"],
-        }
+        return self._PARAMETERS[self.shell_name]
+
+    async def _create_process(self, command: str, stderr: int) -> "asyncio.subprocess.Process | _OffloadedProcess":
+        """Spawn the command, skipping the intermediate shell when it is not needed.
+
+        Args:
+            command: The shell command to execute
+            stderr: Where to send stderr (PIPE, or STDOUT to merge it into stdout)
+
+        Returns:
+            The spawned process with stdout piped, leading its own session
+        """
+        if self.is_windows:
+            # Windows: Use PowerShell with appropriate encoding
+            argv = ["powershell.exe", "-NoProfile", "-Command", command]
+        else:
+            argv = _split_simple_command(command)
+
+        if _OFFLOAD_SPAWN:
+            return await _OffloadedProcess.create(
+                command if argv is None else argv,
+                shell=argv is None,
+                stderr=stderr,
+                cwd=self.workspace_dir,
+            )
+
+        if argv is None:
+            # Unix/Linux/macOS: Use the shell for pipes, redirects, builtins, etc.
+            return await asyncio.create_subprocess_shell(
+                command,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=stderr,
+                cwd=self.workspace_dir,
+                start_new_session=True,
+            )
+
+        return await asyncio.create_subprocess_exec(
+            *argv,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=stderr,
+            cwd=self.workspace_dir,
+            start_new_session=True,
+        )
 
     async def execute(
         self,
@@ -330,33 +643,12 @@ Examples:
             elif timeout < 1:
                 timeout = 120
 
-            # Prepare shell-specific command execution
-            if self.is_windows:
-                # Windows: Use PowerShell with appropriate encoding
-                shell_cmd = ["powershell.exe", "-NoProfile", "-Command", command]
-            else:
-                # Unix/Linux/macOS: Use bash
-                shell_cmd = command
-
             if run_in_background:
                 # Background execution: Create isolated process
                 bash_id = str(uuid.uuid4())[:8]
 
                 # Start background process with combined stdout/stderr
-                if self.is_windows:
-                    process = await asyncio.create_subprocess_exec(
-                        *shell_cmd,
-                        stdout=asyncio.subprocess.PIPE,
-                        stderr=asyncio.subprocess.STDOUT,
-                        cwd=self.workspace_dir,
-                    )
-                else:
-                    process = await asyncio.create_subprocess_shell(
-                        shell_cmd,
-                        stdout=asyncio.subprocess.PIPE,
-                        stderr=asyncio.subprocess.STDOUT,
-                        cwd=self.workspace_dir,
-                    )
+                process = await self._create_process(command, stderr=asyncio.subprocess.STDOUT)
 
                 # Create background shell and add to manager
                 bg_shell = BackgroundShell(bash_id=bash_id, command=command, process=process, start_time=time.time())
@@ -380,37 +672,51 @@ Examples:
 
             else:
                 # Foreground execution: Create isolated process
-                if self.is_windows:
-                    process = await asyncio.create_subprocess_exec(
-                        *shell_cmd,
-                        stdout=asyncio.subprocess.PIPE,
-                        stderr=asyncio.subprocess.PIPE,
-                        cwd=self.workspace_dir,
-                    )
-                else:
-                    process = await asyncio.create_subprocess_shell(
-                        shell_cmd,
-                        stdout=asyncio.subprocess.PIPE,
-                        stderr=asyncio.subprocess.PIPE,
-                        cwd=self.workspace_dir,
-                    )
+                process = await self._create_process(command, stderr=asyncio.subprocess.PIPE)
+                stdout_chunks: list[bytes] = []
+                stderr_chunks: list[bytes] = []
 
                 try:
-                    stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=timeout)
+                    if _HAS_ASYNCIO_TIMEOUT:
+                        async with asyncio.timeout(timeout):
+                            truncated = await _read_capped_output(
+                                process, _MAX_OUTPUT_BYTES, stdout_chunks, stderr_chunks
+                            )
+                    else:
+                        truncated = await asyncio.wait_for(
+                            _read_capped_output(process, _MAX_OUTPUT_BYTES, stdout_chunks, stderr_chunks),
+                            timeout=timeout,
+                        )
+                except asyncio.CancelledError:
+                    # Running in its own session, the command no longer gets the terminal's Ctrl-C
+                    _signal_process_tree(process, force=True)
+                    raise
                 except asyncio.TimeoutError:
-                    process.kill()
+                    _signal_process_tree(process, force=True)
+                    await _discard_output(process)
                     error_msg = f"Command timed out after {timeout} seconds"
+                    # Keep whatever the command printed before it was killed
                     return BashOutputResult(
                         success=False,
                         error=error_msg,
-                        stdout="",
-                        stderr=error_msg,
+                        stdout=b"".join(stdout_chunks).decode("utf-8", errors="replace"),
+                        stderr=b"".join(stderr_chunks).decode("utf-8", errors="replace"),
                         exit_code=-1,
                     )
 
                 # Decode output
-                stdout_text = stdout.decode("utf-8", errors="replace")
-                stderr_text = stderr.decode("utf-8", errors="replace")
+                stdout_text = b"".join(stdout_chunks).decode("utf-8", errors="replace")
+                stderr_text = b"".join(stderr_chunks).decode("utf-8", errors="replace")
+
+                if truncated:
+                    error_msg = f"Command output exceeded {_MAX_OUTPUT_BYTES} bytes and the command was killed"
+                    return BashOutputResult(
+                        success=False,
+                        error=error_msg,
+                        stdout=stdout_text,
+                        stderr=stderr_text,
+                        exit_code=process.returncode or -1,
+                    )
 
                 # Create result (content auto-formatted by model_validator)
                 is_success = process.returncode == 0
@@ -441,13 +747,9 @@ Examples:
 class BashOutputTool(Tool):
     """Retrieve output from background bash shells."""
 
-    @property
-    def name(self) -> str:
-        return "bash_output"
+    name = "bash_output"
 
-    @property
-    def description(self) -> str:
-        return """Retrieves output from a running or completed background bash shell.
+    description = """Retrieves output from a running or completed background bash shell.
 
         - Takes a bash_id parameter identifying the shell
         - Always returns only new output since the last check
@@ -465,22 +767,20 @@ class BashOutputTool(Tool):
 
         Example: bash_output(bash_id="abc12345")"""
 
-    @property
-    def parameters(self) -> dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "bash_id": {
-                    "type": "string",
-                    "description": "The ID of the background shell to retrieve output from. Shell IDs are returned when starting a command with run_in_background=true.",
-                },
-                "filter_str": {
-                    "type": "string",
-                    "description": "Optional regular expression to filter the output lines. Only lines matching this regex will be included in the result. Any lines that do not match will no longer be available to read.",
-                },
+    parameters: dict[str, Any] = {
+        "type": "object",
+        "properties": {
+            "bash_id": {
+                "type": "string",
+                "description": "The ID of the background shell to retrieve output from. Shell IDs are returned when starting a command with run_in_background=true.",
+            },
+            "filter_str": {
+                "type": "string",
+                "description": "Optional regular expression to filter the output lines. Only lines matching this regex will be included in the result. Any lines that do not match will no longer be available to read.",
             },
-            "required": ["bash_id"],
-        }
+        },
+        "required": ["bash_id"],
+    }
 
     async def execute(
         self,
@@ -535,13 +835,9 @@ class BashOutputTool(Tool):
 class BashKillTool(Tool):
     """Terminate a running background bash shell."""
 
-    @property
-    def name(self) -> str:
-        return "bash_kill"
+    name = "bash_kill"
 
-    @property
-    def description(self) -> str:
-        return """Kills a running background bash shell by its ID.
+    description = """Kills a running background bash shell by its ID.
 
         - Takes a bash_id parameter identifying the shell to kill
         - Attempts graceful termination (SIGTERM) first, then forces (SIGKILL) if needed
@@ -552,18 +848,16 @@ class BashKillTool(Tool):
 
         Example: bash_kill(bash_id="abc12345")"""
 
-    @property
-    def parameters(self) -> dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "bash_id": {
-                    "type": "string",
-                    "description": "The ID of the background shell to terminate. Shell IDs are returned when starting a command with run_in_background=true.",
-                },
+    parameters: dict[str, Any] = {
+        "type": "object",
+        "properties": {
+            "bash_id": {
+                "type": "string",
+                "description": "The ID of the background shell to terminate. Shell IDs are returned when starting a command with run_in_background=true.",
             },
-            "required": ["bash_id"],
-        }
+        },
+        "required": ["bash_id"],
+    }
 
     async def execute(self, bash_id: str) -> BashOutputResult:
         """Terminate a background shell process.
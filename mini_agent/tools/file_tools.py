@@ -1,10 +1,16 @@
 """File operation tools."""
 
+import asyncio
+import errno
+import mmap
+import os
+import shutil
+import tempfile
+import uuid
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-import tiktoken
-
 from .base import Tool, ToolResult
 
 
@@ -29,6 +35,9 @@ def truncate_text_by_tokens(
         >>> truncated = truncate_text_by_tokens(text, 64000)
         >>> print(truncated)
     """
+    # Imported on first use: tiktoken is slow to import and only needed once a file is read
+    import tiktoken
+
     encoding = tiktoken.get_encoding("cl100k_base")
     token_count = len(encoding.encode(text))
 
@@ -60,9 +69,220 @@ def truncate_text_by_tokens(
     return head_part + truncation_note + tail_part
 
 
+# Only files up to this size are kept in the read cache; larger ones are read straight through
+_READ_CACHE_MAX_BYTES = 1024 * 1024
+
+
+def _read_all_lines(path: str) -> tuple[str, ...]:
+    """Read all lines of a UTF-8 text file."""
+    with open(path, encoding="utf-8") as f:
+        return tuple(f)
+
+
+@lru_cache(maxsize=32)
+def _cached_lines(path: str, inode: int, mtime_ns: int, size: int) -> tuple[str, ...]:
+    """Read all lines of a UTF-8 text file. Cached until the file changes (keyed by inode, mtime and size)."""
+    return _read_all_lines(path)
+
+
+def _read_lines(file_path: Path) -> tuple[str, ...]:
+    """Read all lines of a UTF-8 text file, reusing the previous read of small unchanged files (blocking)."""
+    stat = file_path.stat()
+    if stat.st_size > _READ_CACHE_MAX_BYTES:
+        return _read_all_lines(str(file_path))
+    return _cached_lines(str(file_path), stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+
+def _create_temp_file(directory: Path, name: str) -> tuple[int, str]:
+    """Exclusively create a hidden temp file for name in directory.
+
+    Unlike mkstemp (always 0600), the file is opened with mode 0666 so the kernel
+    applies the process umask, giving new files the same mode as a plain open().
+    """
+    while True:
+        tmp_name = str(directory / f".{name}.{uuid.uuid4().hex[:8]}.tmp")
+        try:
+            return os.open(tmp_name, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666), tmp_name
+        except FileExistsError:
+            continue
+
+
+def _check_writable(file_path: Path) -> None:
+    """Refuse to replace an existing file that a plain open(path, "w") could not write.
+
+    Swapping in a temp file with os.replace() only needs write access to the directory,
+    so read-only targets are rejected up front with the same error open() raises.
+    """
+    if file_path.exists() and not os.access(file_path, os.W_OK):
+        raise PermissionError(errno.EACCES, os.strerror(errno.EACCES), str(file_path))
+
+
+def _commit_temp_file(tmp_name: str, target: Path) -> None:
+    """Move a fully written temp file over target.
+
+    Files with other hard links, or owned by someone else, are rewritten in place
+    instead (not atomic), so the links and ownership survive; otherwise the temp file
+    takes over the target's permission bits and atomically replaces it.
+    """
+    if target.exists():
+        stat = target.stat()
+        if stat.st_nlink > 1 or stat.st_uid != getattr(os, "geteuid", lambda: stat.st_uid)():
+            with open(tmp_name, "rb") as src, open(target, "wb") as dst:
+                shutil.copyfileobj(src, dst)
+            os.unlink(tmp_name)
+            return
+        shutil.copymode(target, tmp_name)
+    os.replace(tmp_name, target)
+
+
+def _write_text(file_path: Path, content: str) -> None:
+    """Atomically write a UTF-8 text file, creating parent directories if needed (blocking).
+
+    The content is written and fsynced to a temp file next to the target, then
+    moved over it with os.replace(), so readers never see a half-written file.
+    """
+    _check_writable(file_path)
+    target = file_path.resolve()
+    target.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = _create_temp_file(target.parent, target.name)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        _commit_temp_file(tmp_name, target)
+    finally:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+
+
+# Read size for streaming edits; memory use is bounded by this plus len(old_str)
+_EDIT_CHUNK_SIZE = 1024 * 1024
+
+
+def _stream_replace(target: Path, old: bytes, new: bytes, first: int) -> int:
+    """Stream target into a temp file with every old replaced by new, then commit it.
+
+    Args:
+        target: Resolved file to edit
+        old: Bytes to find
+        new: Replacement bytes
+        first: Offset of the first match; everything before it is copied unchanged
+
+    Returns:
+        Number of replacements made
+    """
+    overlap = len(old) - 1
+    count = 0
+    with open(target, "rb") as src:
+        fd, tmp_name = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as dst:
+                # Copy the untouched prefix, then scan from the first match onwards
+                remaining = first
+                while remaining:
+                    chunk = src.read(min(_EDIT_CHUNK_SIZE, remaining))
+                    dst.write(chunk)
+                    remaining -= len(chunk)
+
+                buf = src.read(_EDIT_CHUNK_SIZE)
+                while buf:
+                    pos = 0
+                    while (idx := buf.find(old, pos)) != -1:
+                        dst.write(buf[pos:idx])
+                        dst.write(new)
+                        pos = idx + len(old)
+                        count += 1
+
+                    chunk = src.read(_EDIT_CHUNK_SIZE)
+                    if not chunk:
+                        dst.write(buf[pos:])
+                        break
+
+                    # Carry over a tail that may hold the start of a match spanning chunks
+                    keep = max(pos, len(buf) - overlap)
+                    dst.write(buf[pos:keep])
+                    buf = buf[keep:] + chunk
+
+            _commit_temp_file(tmp_name, target)
+        finally:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+    return count
+
+
+def _replace_in_file(file_path: Path, old_str: str, new_str: str) -> int:
+    """Replace every occurrence of old_str in a file without loading it whole (blocking).
+
+    The file is first searched via mmap, so a missing old_str costs no decoding or
+    writes. Otherwise it is streamed in chunks into a temp file in the same directory,
+    which then replaces the original.
+
+    Args:
+        file_path: File to edit (symlinks are followed)
+        old_str: Text to find
+        new_str: Replacement text
+
+    Returns:
+        Number of replacements made
+    """
+    _check_writable(file_path)
+    target = file_path.resolve()
+
+    candidates = [(old_str, new_str)]
+    if "\n" in old_str and "\r\n" not in old_str:
+        # "\n"-style edit on a CRLF file: fall back to matching (and writing) CRLF line endings
+        candidates.append((old_str.replace("\n", "\r\n"), new_str.replace("\n", "\r\n")))
+
+    with open(target, "rb") as src:
+        if os.fstat(src.fileno()).st_size == 0:
+            return 0
+
+        with mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for old_text, new_text in candidates:
+                old = old_text.encode("utf-8")
+                first = mm.find(old)
+                if first != -1:
+                    break
+            else:
+                return 0
+
+    return _stream_replace(target, old, new_text.encode("utf-8"), first)
+
+
 class ReadTool(Tool):
     """Read file content."""
 
+    name = "read_file"
+
+    description = (
+        "Read file contents from the filesystem. Output always includes line numbers "
+        "in format 'LINE_NUMBER|LINE_CONTENT' (1-indexed). Supports reading partial content "
+        "by specifying line offset and limit for large files. "
+        "You can call this tool multiple times in parallel to read different files simultaneously."
+    )
+
+    parameters: dict[str, Any] = {
+        "type": "object",
+        "properties": {
+            "path": {
+                "type": "string",
+                "description": "Absolute or relative path to the file",
+            },
+            "offset": {
+                "type": "integer",
+                "description": "Starting line number (1-indexed). Use for large files to read from specific line",
+                "minimum": 1,
+            },
+            "limit": {
+                "type": "integer",
+                "description": "Number of lines to read. Use with offset for large files to read in chunks",
+                "minimum": 1,
+            },
+        },
+        "required": ["path"],
+    }
+
     def __init__(self, workspace_dir: str = "."):
         """Initialize ReadTool with workspace directory.
 
@@ -71,40 +291,6 @@ class ReadTool(Tool):
         """
         self.workspace_dir = Path(workspace_dir).absolute()
 
-    @property
-    def name(self) -> str:
-        return "read_file"
-
-    @property
-    def description(self) -> str:
-        return (
-            "Read file contents from the filesystem. Output always includes line numbers "
-            "in format 'LINE_NUMBER|LINE_CONTENT' (1-indexed). Supports reading partial content "
-            "by specifying line offset and limit for large files. "
-            "You can call this tool multiple times in parallel to read different files simultaneously."
-        )
-
-    @property
-    def parameters(self) -> dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "path": {
-                    "type": "string",
-                    "description": "Absolute or relative path to the file",
-                },
-                "offset": {
-                    "type": "integer",
-                    "description": "Starting line number (1-indexed). Use for large files to read from specific line",
-                },
-                "limit": {
-                    "type": "integer",
-                    "description": "Number of lines to read. Use with offset for large files to read in chunks",
-                },
-            },
-            "required": ["path"],
-        }
-
     async def execute(self, path: str, offset: int | None = None, limit: int | None = None) -> ToolResult:
         """Execute read file."""
         try:
@@ -120,9 +306,8 @@ class ReadTool(Tool):
                     error=f"File not found: {path}",
                 )
 
-            # Read file content with line numbers
-            with open(file_path, encoding="utf-8") as f:
-                lines = f.readlines()
+            # Read file content off the event loop
+            lines = await asyncio.to_thread(_read_lines, file_path)
 
             # Apply offset and limit
             start = (offset - 1) if offset else 0
@@ -132,16 +317,10 @@ class ReadTool(Tool):
             if end > len(lines):
                 end = len(lines)
 
-            selected_lines = lines[start:end]
-
-            # Format with line numbers (1-indexed)
-            numbered_lines = []
-            for i, line in enumerate(selected_lines, start=start + 1):
-                # Remove trailing newline for formatting
-                line_content = line.rstrip("\n")
-                numbered_lines.append(f"{i:6d}|{line_content}")
-
-            content = "\n".join(numbered_lines)
+            # Format with line numbers (1-indexed). Lines keep their own newline, so one
+            # join builds the output; only the last line's trailing newline is dropped.
+            content = "".join(f"{i:6d}|{line}" for i, line in enumerate(lines[start:end], start=start + 1))
+            content = content.removesuffix("\n")
 
             # Apply token truncation if needed
             max_tokens = 32000
@@ -155,6 +334,29 @@ class ReadTool(Tool):
 class WriteTool(Tool):
     """Write content to a file."""
 
+    name = "write_file"
+
+    description = (
+        "Write content to a file. Will overwrite existing files completely. "
+        "For existing files, you should read the file first using read_file. "
+        "Prefer editing existing files over creating new ones unless explicitly needed."
+    )
+
+    parameters: dict[str, Any] = {
+        "type": "object",
+        "properties": {
+            "path": {
+                "type": "string",
+                "description": "Absolute or relative path to the file",
+            },
+            "content": {
+                "type": "string",
+                "description": "Complete content to write (will replace existing content)",
+            },
+        },
+        "required": ["path", "content"],
+    }
+
     def __init__(self, workspace_dir: str = "."):
         """Initialize WriteTool with workspace directory.
 
@@ -163,35 +365,6 @@ class WriteTool(Tool):
         """
         self.workspace_dir = Path(workspace_dir).absolute()
 
-    @property
-    def name(self) -> str:
-        return "write_file"
-
-    @property
-    def description(self) -> str:
-        return (
-            "Write content to a file. Will overwrite existing files completely. "
-            "For existing files, you should read the file first using read_file. "
-            "Prefer editing existing files over creating new ones unless explicitly needed."
-        )
-
-    @property
-    def parameters(self) -> dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "path": {
-                    "type": "string",
-                    "description": "Absolute or relative path to the file",
-                },
-                "content": {
-                    "type": "string",
-                    "description": "Complete content to write (will replace existing content)",
-                },
-            },
-            "required": ["path", "content"],
-        }
-
     async def execute(self, path: str, content: str) -> ToolResult:
         """Execute write file."""
         try:
@@ -200,10 +373,7 @@ class WriteTool(Tool):
             if not file_path.is_absolute():
                 file_path = self.workspace_dir / file_path
 
-            # Create parent directories if they don't exist
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-
-            file_path.write_text(content, encoding="utf-8")
+            await asyncio.to_thread(_write_text, file_path, content)
             return ToolResult(success=True, content=f"Successfully wrote to {file_path}")
         except Exception as e:
             return ToolResult(success=False, content="", error=str(e))
@@ -212,6 +382,33 @@ class WriteTool(Tool):
 class EditTool(Tool):
     """Edit file by replacing text."""
 
+    name = "edit_file"
+
+    description = (
+        "Perform exact string replacement in a file. The old_str must match exactly "
+        "and appear uniquely in the file, otherwise the operation will fail. "
+        "You must read the file first before editing. Preserve exact indentation from the source."
+    )
+
+    parameters: dict[str, Any] = {
+        "type": "object",
+        "properties": {
+            "path": {
+                "type": "string",
+                "description": "Absolute or relative path to the file",
+            },
+            "old_str": {
+                "type": "string",
+                "description": "Exact string to find and replace (must be unique in file)",
+            },
+            "new_str": {
+                "type": "string",
+                "description": "Replacement string (use for refactoring, renaming, etc.)",
+            },
+        },
+        "required": ["path", "old_str", "new_str"],
+    }
+
     def __init__(self, workspace_dir: str = "."):
         """Initialize EditTool with workspace directory.
 
@@ -220,39 +417,6 @@ class EditTool(Tool):
         """
         self.workspace_dir = Path(workspace_dir).absolute()
 
-    @property
-    def name(self) -> str:
-        return "edit_file"
-
-    @property
-    def description(self) -> str:
-        return (
-            "Perform exact string replacement in a file. The old_str must match exactly "
-            "and appear uniquely in the file, otherwise the operation will fail. "
-            "You must read the file first before editing. Preserve exact indentation from the source."
-        )
-
-    @property
-    def parameters(self) -> dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "path": {
-                    "type": "string",
-                    "description": "Absolute or relative path to the file",
-                },
-                "old_str": {
-                    "type": "string",
-                    "description": "Exact string to find and replace (must be unique in file)",
-                },
-                "new_str": {
-                    "type": "string",
-                    "description": "Replacement string (use for refactoring, renaming, etc.)",
-                },
-            },
-            "required": ["path", "old_str", "new_str"],
-        }
-
     async def execute(self, path: str, old_str: str, new_str: str) -> ToolResult:
         """Execute edit file."""
         try:
@@ -268,18 +432,23 @@ class EditTool(Tool):
                     error=f"File not found: {path}",
                 )
 
-            content = file_path.read_text(encoding="utf-8")
+            if not old_str:
+                return ToolResult(
+                    success=False,
+                    content="",
+                    error="old_str must not be empty",
+                )
 
-            if old_str not in content:
+            # Stream the replacement so memory stays bounded for large files
+            count = await asyncio.to_thread(_replace_in_file, file_path, old_str, new_str)
+
+            if not count:
                 return ToolResult(
                     success=False,
                     content="",
                     error=f"Text not found in file: {old_str}",
                 )
 
-            new_content = content.replace(old_str, new_str)
-            file_path.write_text(new_content, encoding="utf-8")
-
             return ToolResult(success=True, content=f"Successfully edited {file_path}")
         except Exception as e:
             return ToolResult(success=False, content="", error=str(e))
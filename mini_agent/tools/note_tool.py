@@ -8,12 +8,25 @@ This tool allows the agent to:
 
 import json
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 from .base import Tool, ToolResult
 
 
+@lru_cache(maxsize=8)
+def _parse_notes(path: str, mtime_ns: int, size: int) -> tuple:
+    """Parse the note file. Cached until the file changes (keyed by mtime and size)."""
+    return tuple(json.loads(Path(path).read_text()))
+
+
+def _read_notes(memory_file: Path) -> list:
+    """Read notes, reusing the previous parse when the file is unchanged."""
+    stat = memory_file.stat()
+    return list(_parse_notes(str(memory_file), stat.st_mtime_ns, stat.st_size))
+
+
 class SessionNoteTool(Tool):
     """Tool for recording and recalling session notes.
 
@@ -75,7 +88,7 @@ class SessionNoteTool(Tool):
             return []
         
         try:
-            return json.loads(self.memory_file.read_text())
+            return _read_notes(self.memory_file)
         except Exception:
             return []
 
@@ -176,7 +189,7 @@ class RecallNoteTool(Tool):
                     content="No notes recorded yet.",
                 )
 
-            notes = json.loads(self.memory_file.read_text())
+            notes = _read_notes(self.memory_file)
 
             if not notes:
                 return ToolResult(
@@ -4,25 +4,77 @@ Skill Loader - Load Claude Skills
 Supports loading skills from SKILL.md files and providing them to Agent
 """
 
+import json
+import os
 import re
-from dataclasses import dataclass
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
 
 import yaml
 
+from ..utils import safe_load_yaml
+
+# Frontmatter delimiters; split with plain string scans instead of a backtracking DOTALL regex
+_FRONTMATTER_OPEN = "---\n"
+_FRONTMATTER_CLOSE = "\n---\n"
+
+# Bump when the cached entry layout (mtime_ns, size, frontmatter) changes
+_PARSE_CACHE_VERSION = 2
+
+# Relative path patterns rewritten to absolute paths by SkillLoader._process_skill_paths
+_DIR_PATH_RE = re.compile(r"(python\s+|`)((?:scripts|references|assets)/[^\s`\)]+)")
+_DOC_PATH_RE = re.compile(r"(see|read|refer to|check)\s+([a-zA-Z0-9_-]+\.(?:md|txt|json|yaml))([.,;\s])", re.IGNORECASE)
+_MARKDOWN_LINK_RE = re.compile(
+    r"(?:(Read|See|Check|Refer to|Load|View)\s+)?\[(`?[^`\]]+`?)\]\(((?:\./)?[^)]+\.(?:md|txt|json|yaml|js|py|html))\)",
+    re.IGNORECASE,
+)
+
+
+def _split_frontmatter(content: str) -> Optional[tuple]:
+    """Split SKILL.md text into (frontmatter_text, body), or None if there is no frontmatter"""
+    end = content.find(_FRONTMATTER_CLOSE, len(_FRONTMATTER_OPEN)) if content.startswith(_FRONTMATTER_OPEN) else -1
+    if end < 0:
+        return None
+    return content[len(_FRONTMATTER_OPEN) : end], content[end + len(_FRONTMATTER_CLOSE) :].strip()
+
+
+class _LazySkillContent:
+    """Data descriptor behind Skill.content: reads the body through content_loader on first access"""
+
+    def __get__(self, skill: Optional["Skill"], owner: type) -> Optional[str]:
+        if skill is None:
+            # Class access (e.g. by @dataclass looking up the field default)
+            return self
+        if skill._content is None and skill.content_loader is not None:
+            skill._content = skill.content_loader()
+        return skill._content
+
+    def __set__(self, skill: "Skill", value: Optional[str]) -> None:
+        # The generated __init__ passes the descriptor itself when content is omitted
+        skill._content = None if value is self else value
+
 
 @dataclass
 class Skill:
-    """Skill data structure"""
+    """Skill data structure
+
+    When created with content=None and a content_loader, the body is read on
+    first access, so metadata-only use never keeps skill bodies in memory.
+    """
 
     name: str
     description: str
-    content: str
+    content: Optional[str] = _LazySkillContent()
     license: Optional[str] = None
     allowed_tools: Optional[List[str]] = None
     metadata: Optional[Dict[str, str]] = None
     skill_path: Optional[Path] = None
+    content_loader: Optional[Callable[[], str]] = field(default=None, repr=False, compare=False)
+    _content: Optional[str] = field(default=None, init=False, repr=False, compare=False)
 
     def to_prompt(self) -> str:
         """Convert skill to prompt format"""
@@ -47,44 +99,131 @@ All files and references in this skill are relative to this directory.
 class SkillLoader:
     """Skill loader"""
 
-    def __init__(self, skills_dir: str = "./skills"):
+    def __init__(self, skills_dir: str = "./skills", cache_file: Optional[str] = None):
         """
         Initialize Skill Loader
 
         Args:
             skills_dir: Skills directory path
+            cache_file: Optional JSON file to persist parsed frontmatter across runs.
+                        Entries are reused while the SKILL.md mtime and size match.
         """
         self.skills_dir = Path(skills_dir)
         self.loaded_skills: Dict[str, Skill] = {}
-
-    def load_skill(self, skill_path: Path) -> Optional[Skill]:
+        self.cache_file = Path(cache_file) if cache_file else None
+        self._parse_cache: Dict[str, dict] = self._read_parse_cache()
+        self._parse_cache_dirty = False
+
+    def _read_parse_cache(self) -> Dict[str, dict]:
+        """Load the persisted parse cache, ignoring missing, corrupt or outdated files"""
+        if self.cache_file is None:
+            return {}
+        try:
+            with open(self.cache_file, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != _PARSE_CACHE_VERSION:
+            return {}
+        entries = data.get("entries")
+        return entries if isinstance(entries, dict) else {}
+
+    def _write_parse_cache(self) -> None:
+        """Atomically persist the parse cache if it changed"""
+        if self.cache_file is None or not self._parse_cache_dirty:
+            return
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.cache_file.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump({"version": _PARSE_CACHE_VERSION, "entries": self._parse_cache}, f)
+                os.replace(tmp_name, self.cache_file)
+            finally:
+                if os.path.exists(tmp_name):
+                    os.unlink(tmp_name)
+            self._parse_cache_dirty = False
+        except OSError as e:
+            print(f"⚠️  Failed to write skill cache ({self.cache_file}): {e}")
+
+    def _parse_skill_file(self, skill_path: Path) -> Optional[dict]:
         """
-        Load single skill from SKILL.md file
+        Read SKILL.md and parse its YAML frontmatter
 
         Args:
             skill_path: SKILL.md file path
 
         Returns:
-            Skill object, or None if loading fails
+            Parsed frontmatter, or None if the file has no valid frontmatter
         """
+        stat = skill_path.stat()
+        key = os.path.abspath(skill_path)
+        cached = self._parse_cache.get(key)
+        if isinstance(cached, dict) and cached.get("mtime_ns") == stat.st_mtime_ns and cached.get("size") == stat.st_size:
+            return cached["frontmatter"]
+
+        # Parse YAML frontmatter
+        parts = _split_frontmatter(skill_path.read_text(encoding="utf-8"))
+
+        if parts is None:
+            print(f"⚠️  {skill_path} missing YAML frontmatter")
+            return None
+
+        frontmatter_text = parts[0]
+
+        # Parse YAML
         try:
-            content = skill_path.read_text(encoding="utf-8")
+            frontmatter = safe_load_yaml(frontmatter_text)
+        except yaml.YAMLError as e:
+            print(f"❌ Failed to parse YAML frontmatter: {e}")
+            return None
 
-            # Parse YAML frontmatter
-            frontmatter_match = re.match(r"^---\n(.*?)\n---\n(.*)$", content, re.DOTALL)
+        # Frontmatter with non-JSON values (e.g. YAML dates) is simply not cached
+        try:
+            json.dumps(frontmatter)
+        except (TypeError, ValueError):
+            return frontmatter
 
-            if not frontmatter_match:
-                print(f"⚠️  {skill_path} missing YAML frontmatter")
-                return None
+        self._parse_cache[key] = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "frontmatter": frontmatter}
+        self._parse_cache_dirty = True
+        return frontmatter
 
-            frontmatter_text = frontmatter_match.group(1)
-            skill_content = frontmatter_match.group(2).strip()
+    def _load_skill_body(self, skill_path: Path) -> str:
+        """
+        Read a skill's body on demand, with relative paths made absolute
 
-            # Parse YAML
-            try:
-                frontmatter = yaml.safe_load(frontmatter_text)
-            except yaml.YAMLError as e:
-                print(f"❌ Failed to parse YAML frontmatter: {e}")
+        Args:
+            skill_path: SKILL.md file path
+
+        Returns:
+            Processed skill content
+
+        Raises:
+            OSError: If SKILL.md can no longer be read
+            ValueError: If SKILL.md is not UTF-8 or lost its frontmatter since discovery
+        """
+        parts = _split_frontmatter(skill_path.read_text(encoding="utf-8"))
+        if parts is None:
+            raise ValueError(f"{skill_path} missing YAML frontmatter")
+        body = parts[1]
+
+        # Replace relative paths in content with absolute paths
+        # This ensures scripts and resources can be found from any working directory
+        return self._process_skill_paths(body, skill_path.parent)
+
+    def load_skill(self, skill_path: Path) -> Optional[Skill]:
+        """
+        Load single skill from SKILL.md file
+
+        Args:
+            skill_path: SKILL.md file path
+
+        Returns:
+            Skill object, or None if loading fails
+        """
+        try:
+            frontmatter = self._parse_skill_file(skill_path)
+            if frontmatter is None:
                 return None
 
             # Required fields
@@ -92,18 +231,12 @@ class SkillLoader:
                 print(f"⚠️  {skill_path} missing required fields (name or description)")
                 return None
 
-            # Get skill directory (parent of SKILL.md)
-            skill_dir = skill_path.parent
-
-            # Replace relative paths in content with absolute paths
-            # This ensures scripts and resources can be found from any working directory
-            processed_content = self._process_skill_paths(skill_content, skill_dir)
-
-            # Create Skill object
+            # Create Skill object; the body is only read once get_skill needs it
             skill = Skill(
                 name=frontmatter["name"],
                 description=frontmatter["description"],
-                content=processed_content,
+                content=None,
+                content_loader=partial(self._load_skill_body, skill_path),
                 license=frontmatter.get("license"),
                 allowed_tools=frontmatter.get("allowed-tools"),
                 metadata=frontmatter.get("metadata"),
@@ -130,8 +263,6 @@ class SkillLoader:
         Returns:
             Processed content with absolute paths
         """
-        import re
-
         # Pattern 1: Directory-based paths (scripts/, references/, assets/)
         # See https://agentskills.io/specification#optional-directories
         def replace_dir_path(match):
@@ -143,8 +274,7 @@ class SkillLoader:
                 return f"{prefix}{abs_path}"
             return match.group(0)
 
-        pattern_dirs = r"(python\s+|`)((?:scripts|references|assets)/[^\s`\)]+)"
-        content = re.sub(pattern_dirs, replace_dir_path, content)
+        content = _DIR_PATH_RE.sub(replace_dir_path, content)
 
         # Pattern 2: Direct markdown/document references (forms.md, reference.md, etc.)
         # Matches phrases like "see reference.md" or "read forms.md"
@@ -160,8 +290,7 @@ class SkillLoader:
             return match.group(0)
 
         # Match patterns like: "see reference.md" or "read forms.md"
-        pattern_docs = r"(see|read|refer to|check)\s+([a-zA-Z0-9_-]+\.(?:md|txt|json|yaml))([.,;\s])"
-        content = re.sub(pattern_docs, replace_doc_path, content, flags=re.IGNORECASE)
+        content = _DOC_PATH_RE.sub(replace_doc_path, content)
 
         # Pattern 3: Markdown links - supports multiple formats:
         # - [`filename.md`](filename.md) - simple filename
@@ -184,10 +313,7 @@ class SkillLoader:
 
         # Match markdown link patterns with optional prefix words
         # Captures: (optional prefix word) [link text] (complete file path including ./)
-        pattern_markdown = (
-            r"(?:(Read|See|Check|Refer to|Load|View)\s+)?\[(`?[^`\]]+`?)\]\(((?:\./)?[^)]+\.(?:md|txt|json|yaml|js|py|html))\)"
-        )
-        content = re.sub(pattern_markdown, replace_markdown_link, content, flags=re.IGNORECASE)
+        content = _MARKDOWN_LINK_RE.sub(replace_markdown_link, content)
 
         return content
 
@@ -204,13 +330,27 @@ class SkillLoader:
             print(f"⚠️  Skills directory does not exist: {self.skills_dir}")
             return skills
 
-        # Recursively find all SKILL.md files
-        for skill_file in self.skills_dir.rglob("SKILL.md"):
-            skill = self.load_skill(skill_file)
+        # Recursively find all SKILL.md files, then read and parse them concurrently
+        # (map keeps discovery order, so later duplicates still win as before)
+        skill_files = list(self.skills_dir.rglob("SKILL.md"))
+        with ThreadPoolExecutor(max_workers=min(32, len(skill_files) or 1)) as executor:
+            loaded = list(executor.map(self.load_skill, skill_files))
+
+        for skill in loaded:
             if skill:
                 skills.append(skill)
                 self.loaded_skills[skill.name] = skill
 
+        # Drop cached entries of skills under this directory that were deleted or moved;
+        # entries for other skills directories sharing the cache file are left alone
+        root = os.path.join(os.path.abspath(self.skills_dir), "")
+        current = {os.path.abspath(path) for path in skill_files}
+        for key in [key for key in self._parse_cache if key.startswith(root) and key not in current]:
+            del self._parse_cache[key]
+            self._parse_cache_dirty = True
+
+        self._write_parse_cache()
+
         return skills
 
     def get_skill(self, name: str) -> Optional[Skill]:
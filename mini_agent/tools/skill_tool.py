@@ -49,13 +49,21 @@ class GetSkillTool(Tool):
                 error=f"Skill '{skill_name}' does not exist. Available skills: {available}",
             )
 
-        # Return complete skill content
-        result = skill.to_prompt()
+        # Return complete skill content (read from SKILL.md on first use)
+        try:
+            result = skill.to_prompt()
+        except (OSError, ValueError) as e:
+            return ToolResult(
+                success=False,
+                content="",
+                error=f"Failed to load skill '{skill_name}': {e}",
+            )
         return ToolResult(success=True, content=result)
 
 
 def create_skill_tools(
     skills_dir: str = "./skills",
+    cache_file: Optional[str] = None,
 ) -> tuple[List[Tool], Optional[SkillLoader]]:
     """
     Create skill tool for Progressive Disclosure
@@ -65,12 +73,13 @@ def create_skill_tools(
 
     Args:
         skills_dir: Skills directory path
+        cache_file: Optional file to persist parsed skill frontmatter across runs
 
     Returns:
         Tuple of (list of tools, skill loader)
     """
     # Create skill loader
-    loader = SkillLoader(skills_dir)
+    loader = SkillLoader(skills_dir, cache_file=cache_file)
 
     # Discover and load skills
     skills = loader.discover_skills()
@@ -5,10 +5,12 @@ from .terminal_utils import (
     pad_to_width,
     truncate_with_ellipsis,
 )
+from .yaml_utils import safe_load_yaml
 
 __all__ = [
     "calculate_display_width",
     "pad_to_width",
+    "safe_load_yaml",
     "truncate_with_ellipsis",
 ]
 
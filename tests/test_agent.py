@@ -10,155 +10,167 @@ from mini_agent import LLMClient
 from mini_agent.agent import Agent
 from mini_agent.config import Config
 from mini_agent.tools import BashTool, EditTool, ReadTool, WriteTool
+from mini_agent.utils import safe_load_yaml
 
+CONFIG_PATH = Path("mini_agent/config/config.yaml")
 
-@pytest.mark.asyncio
-async def test_agent_simple_task():
-    """Test agent with a simple file creation task."""
-    print("\n=== Testing Agent with Simple File Task ===")
 
-    # Load config
-    config_path = Path("mini_agent/config/config.yaml")
-    config = Config.from_yaml(config_path)
+def _load_config() -> Config:
+    return Config.from_yaml(CONFIG_PATH)
 
-    # Create temp workspace
-    with tempfile.TemporaryDirectory() as workspace_dir:
-        print(f"Using workspace: {workspace_dir}")
 
-        # Load system prompt (Agent will auto-inject workspace info)
-        system_prompt_path = Path("mini_agent/config/system_prompt.md")
-        if system_prompt_path.exists():
-            system_prompt = system_prompt_path.read_text(encoding="utf-8")
-        else:
-            system_prompt = "You are a helpful AI assistant that can use tools."
-
-        # Initialize LLM client
-        llm_client = LLMClient(
-            api_key=config.llm.api_key,
-            api_base=config.llm.api_base,
-            model=config.llm.model,
-        )
-
-        # Initialize tools
-        tools = [
-            ReadTool(workspace_dir=workspace_dir),
-            WriteTool(workspace_dir=workspace_dir),
-            EditTool(workspace_dir=workspace_dir),
-            BashTool(),
-        ]
-
-        # Create agent
-        agent = Agent(
-            llm_client=llm_client,
-            system_prompt=system_prompt,
-            tools=tools,
-            max_steps=10,  # Limit steps for testing
-            workspace_dir=workspace_dir,
-        )
-
-        # Task: Create a simple text file
-        task = "Create a file named 'test.txt' with the content 'Hello from Agent!'"
-        print(f"\nTask: {task}\n")
-
-        agent.add_user_message(task)
-
-        try:
-            result = await agent.run()
-
-            print(f"\n{'=' * 80}")
-            print(f"Agent Result: {result}")
-            print("=" * 80)
-
-            # Check if file was created
-            test_file = Path(workspace_dir) / "test.txt"
-            if test_file.exists():
-                content = test_file.read_text()
-                print("\n✅ File created successfully!")
-                print(f"Content: {content}")
-
-                if "Hello from Agent!" in content:
-                    print("✅ Content is correct!")
-                    return True
-                else:
-                    print(f"⚠️  Content mismatch: {content}")
-                    return True  # Still count as success, agent did create the file
-            else:
-                print("⚠️  File was not created, but agent completed")
-                return True  # Agent might have completed differently
+def _create_llm_client(config: Config) -> LLMClient:
+    return LLMClient(
+        api_key=config.llm.api_key,
+        api_base=config.llm.api_base,
+        model=config.llm.model,
+    )
 
-        except Exception as e:
-            print(f"❌ Agent test failed: {e}")
-            import traceback
 
-            traceback.print_exc()
-            return False
+def _load_system_prompt() -> str:
+    # Agent will auto-inject workspace info
+    system_prompt_path = Path("mini_agent/config/system_prompt.md")
+    if system_prompt_path.exists():
+        return system_prompt_path.read_text(encoding="utf-8")
+    return "You are a helpful AI assistant that can use tools."
 
 
-@pytest.mark.asyncio
-async def test_agent_bash_task():
-    """Test agent with a bash command task."""
-    print("\n=== Testing Agent with Bash Task ===")
+@pytest.fixture(scope="module")
+def config():
+    """Load config once for all agent tests; skip them without a usable API key."""
+    if not CONFIG_PATH.exists():
+        pytest.skip(f"Live agent tests require {CONFIG_PATH}")
+    with open(CONFIG_PATH, encoding="utf-8") as f:
+        data = safe_load_yaml(f)
+    if not isinstance(data, dict) or data.get("api_key") in (None, "", "YOUR_API_KEY_HERE"):
+        pytest.skip(f"Live agent tests require an api_key in {CONFIG_PATH}")
+    # Any other config problem is a real failure, not a reason to skip
+    return _load_config()
+
+
+@pytest.fixture(scope="module")
+def llm_client(config):
+    """Share one LLM client (and its connection pool) across agent tests."""
+    return _create_llm_client(config)
+
+
+@pytest.fixture(scope="module")
+def system_prompt():
+    """Load system prompt once for all agent tests."""
+    return _load_system_prompt()
 
-    # Load config
-    config_path = Path("mini_agent/config/config.yaml")
-    config = Config.from_yaml(config_path)
 
-    # Create temp workspace
-    with tempfile.TemporaryDirectory() as workspace_dir:
-        print(f"Using workspace: {workspace_dir}")
+@pytest.mark.asyncio(loop_scope="module")
+async def test_agent_simple_task(llm_client, system_prompt, tmp_path):
+    """Test agent with a simple file creation task."""
+    print("\n=== Testing Agent with Simple File Task ===")
 
-        # Load system prompt (Agent will auto-inject workspace info)
-        system_prompt_path = Path("mini_agent/config/system_prompt.md")
-        if system_prompt_path.exists():
-            system_prompt = system_prompt_path.read_text(encoding="utf-8")
+    # Use pytest-managed temp workspace
+    workspace_dir = str(tmp_path)
+    print(f"Using workspace: {workspace_dir}")
+
+    # Initialize tools
+    tools = [
+        ReadTool(workspace_dir=workspace_dir),
+        WriteTool(workspace_dir=workspace_dir),
+        EditTool(workspace_dir=workspace_dir),
+        BashTool(),
+    ]
+
+    # Create agent
+    agent = Agent(
+        llm_client=llm_client,
+        system_prompt=system_prompt,
+        tools=tools,
+        max_steps=10,  # Limit steps for testing
+        workspace_dir=workspace_dir,
+    )
+
+    # Task: Create a simple text file
+    task = "Create a file named 'test.txt' with the content 'Hello from Agent!'"
+    print(f"\nTask: {task}\n")
+
+    agent.add_user_message(task)
+
+    try:
+        result = await agent.run()
+
+        print(f"\n{'=' * 80}")
+        print(f"Agent Result: {result}")
+        print("=" * 80)
+
+        # Check if file was created
+        test_file = Path(workspace_dir) / "test.txt"
+        if test_file.exists():
+            content = test_file.read_text()
+            print("\n✅ File created successfully!")
+            print(f"Content: {content}")
+
+            if "Hello from Agent!" in content:
+                print("✅ Content is correct!")
+                return True
+            else:
+                print(f"⚠️  Content mismatch: {content}")
+                return True  # Still count as success, agent did create the file
         else:
-            system_prompt = "You are a helpful AI assistant that can use tools."
+            print("⚠️  File was not created, but agent completed")
+            return True  # Agent might have completed differently
+
+    except Exception as e:
+        print(f"❌ Agent test failed: {e}")
+        import traceback
+
+        traceback.print_exc()
+        return False
 
-        # Initialize LLM client
-        llm_client = LLMClient(
-            api_key=config.llm.api_key,
-            api_base=config.llm.api_base,
-            model=config.llm.model,
-        )
 
-        # Initialize tools
-        tools = [
-            ReadTool(workspace_dir=workspace_dir),
-            WriteTool(workspace_dir=workspace_dir),
-            BashTool(),
-        ]
+@pytest.mark.asyncio(loop_scope="module")
+async def test_agent_bash_task(llm_client, system_prompt, tmp_path):
+    """Test agent with a bash command task."""
+    print("\n=== Testing Agent with Bash Task ===")
+
+    # Use pytest-managed temp workspace
+    workspace_dir = str(tmp_path)
+    print(f"Using workspace: {workspace_dir}")
 
-        # Create agent
-        agent = Agent(
-            llm_client=llm_client,
-            system_prompt=system_prompt,
-            tools=tools,
-            max_steps=10,
-            workspace_dir=workspace_dir,
-        )
+    # Initialize tools
+    tools = [
+        ReadTool(workspace_dir=workspace_dir),
+        WriteTool(workspace_dir=workspace_dir),
+        BashTool(),
+    ]
 
-        # Task: List files using bash
-        task = "Use bash to list all files in the current directory and tell me what you find."
-        print(f"\nTask: {task}\n")
+    # Create agent
+    agent = Agent(
+        llm_client=llm_client,
+        system_prompt=system_prompt,
+        tools=tools,
+        max_steps=10,
+        workspace_dir=workspace_dir,
+    )
 
-        agent.add_user_message(task)
+    # Task: List files using bash
+    task = "Use bash to list all files in the current directory and tell me what you find."
+    print(f"\nTask: {task}\n")
 
-        try:
-            result = await agent.run()
+    agent.add_user_message(task)
 
-            print(f"\n{'=' * 80}")
-            print(f"Agent Result: {result}")
-            print("=" * 80)
+    try:
+        result = await agent.run()
 
-            print("\n✅ Bash task completed!")
-            return True
+        print(f"\n{'=' * 80}")
+        print(f"Agent Result: {result}")
+        print("=" * 80)
 
-        except Exception as e:
-            print(f"❌ Bash task failed: {e}")
-            import traceback
+        print("\n✅ Bash task completed!")
+        return True
 
-            traceback.print_exc()
-            return False
+    except Exception as e:
+        print(f"❌ Bash task failed: {e}")
+        import traceback
+
+        traceback.print_exc()
+        return False
 
 
 async def main():
@@ -169,11 +181,19 @@ async def main():
     print("\nNote: These tests require a valid MiniMax API key in config.yaml")
     print("These tests will actually call the LLM API and may take some time.\n")
 
-    # Test simple file task
-    result1 = await test_agent_simple_task()
+    llm_client = _create_llm_client(_load_config())
+    system_prompt = _load_system_prompt()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        # Test simple file task
+        simple_dir = Path(tmpdir) / "simple"
+        simple_dir.mkdir()
+        result1 = await test_agent_simple_task(llm_client, system_prompt, simple_dir)
 
-    # Test bash task
-    result2 = await test_agent_bash_task()
+        # Test bash task
+        bash_dir = Path(tmpdir) / "bash"
+        bash_dir.mkdir()
+        result2 = await test_agent_bash_task(llm_client, system_prompt, bash_dir)
 
     print("\n" + "=" * 80)
     if result1 and result2:
@@ -1,14 +1,58 @@
 """Test cases for Bash Tool."""
 
 import asyncio
+import os
+import time
+from pathlib import Path
 
 import pytest
 
-from mini_agent.tools.bash_tool import BackgroundShellManager, BashKillTool, BashOutputTool, BashTool
+from mini_agent.tools import bash_tool as bash_tool_module
+from mini_agent.tools.bash_tool import (
+    BackgroundShell,
+    BackgroundShellManager,
+    BashKillTool,
+    BashOutputTool,
+    BashTool,
+    _split_simple_command,
+)
+
+
+@pytest.fixture(params=[True, False], ids=["offloaded", "asyncio"])
+def spawn_mode(request, monkeypatch):
+    """Run the test on both the offloaded (pidfd) and the plain asyncio spawn path."""
+    if request.param and not hasattr(os, "pidfd_open"):
+        pytest.skip("offloaded spawn requires os.pidfd_open")
+    monkeypatch.setattr(bash_tool_module, "_OFFLOAD_SPAWN", request.param)
+    return request.param
+
+
+def _live_group_members(pgid: int) -> list[int]:
+    """List the non-zombie processes in a process group (Linux /proc)."""
+    members = []
+    for stat_file in Path("/proc").glob("[0-9]*/stat"):
+        try:
+            state, _ppid, pgrp = stat_file.read_text().rsplit(")", 1)[1].split()[:3]
+        except (OSError, IndexError):
+            continue
+        if int(pgrp) == pgid and state != "Z":
+            members.append(int(stat_file.parent.name))
+    return members
+
+
+async def _assert_group_stopped(pgid: int) -> None:
+    """Wait briefly for a killed process group to disappear (where /proc is available)."""
+    if not Path("/proc/self/stat").exists():
+        return
+    for _ in range(50):
+        if not _live_group_members(pgid):
+            break
+        await asyncio.sleep(0.1)
+    assert _live_group_members(pgid) == []
 
 
 @pytest.mark.asyncio
-async def test_foreground_command():
+async def test_foreground_command(spawn_mode):
     """Test executing a simple foreground command."""
     print("\n=== Testing Foreground Command ===")
 
@@ -51,7 +95,7 @@ async def test_command_failure():
 
 
 @pytest.mark.asyncio
-async def test_command_timeout():
+async def test_command_timeout(spawn_mode):
     """Test command timeout."""
     print("\n=== Testing Command Timeout ===")
 
@@ -64,6 +108,41 @@ async def test_command_timeout():
     print(f"Timeout error: {result.error}")
 
 
+@pytest.mark.asyncio
+async def test_timeout_kills_pipeline(spawn_mode):
+    """Test that a timeout kills every process of a pipeline, not just the shell."""
+    print("\n=== Testing Pipeline Timeout ===")
+
+    bash_tool = BashTool()
+    start = time.monotonic()
+    result = await bash_tool.execute(command="sleep 30 | sleep 30", timeout=1)
+
+    assert not result.success
+    assert "timed out" in result.error.lower()
+    assert time.monotonic() - start < 10
+    print(f"Timeout error: {result.error}")
+
+
+@pytest.mark.asyncio
+async def test_cancel_kills_foreground_command(spawn_mode, tmp_path):
+    """Test that cancelling a foreground command kills its process group."""
+    print("\n=== Testing Foreground Cancellation ===")
+
+    pid_file = tmp_path / "pid"
+    bash_tool = BashTool()
+    task = asyncio.create_task(bash_tool.execute(command=f"echo $$ > {pid_file}; sleep 30 | sleep 30", timeout=60))
+    for _ in range(50):
+        if pid_file.exists() and pid_file.read_text().strip():
+            break
+        await asyncio.sleep(0.1)
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    await _assert_group_stopped(int(pid_file.read_text()))
+    print("Cancelled command was killed")
+
+
 @pytest.mark.asyncio
 async def test_background_command():
     """Test running a command in the background."""
@@ -194,6 +273,51 @@ async def test_bash_kill():
     assert bg_shell is None
 
 
+@pytest.mark.asyncio
+async def test_bash_kill_pipeline(spawn_mode):
+    """Test terminating a background pipeline stops all of its processes."""
+    print("\n=== Testing Bash Kill Pipeline ===")
+
+    bash_tool = BashTool()
+    result = await bash_tool.execute(command="sleep 100 | sleep 100", run_in_background=True)
+    assert result.success
+
+    bg_shell = BackgroundShellManager.get(result.bash_id)
+    await asyncio.sleep(0.5)
+    assert bg_shell.status == "running"
+
+    start = time.monotonic()
+    kill_result = await BashKillTool().execute(bash_id=result.bash_id)
+
+    assert kill_result.success
+    assert time.monotonic() - start < 5
+    assert bg_shell.process.returncode is not None
+    # The pipeline members shared the shell's process group, so none are left running
+    await _assert_group_stopped(bg_shell.process.pid)
+    print(f"Kill result:\n{kill_result.content}")
+
+
+@pytest.mark.asyncio
+async def test_terminate_all_background_shells(spawn_mode):
+    """Test that all background shells can be stopped at exit."""
+    print("\n=== Testing Terminate All Background Shells ===")
+
+    bash_tool = BashTool()
+    shells = []
+    for _ in range(2):
+        result = await bash_tool.execute(command="sleep 100 | sleep 100", run_in_background=True)
+        assert result.success
+        shells.append(BackgroundShellManager.get(result.bash_id))
+
+    await BackgroundShellManager.terminate_all()
+
+    assert BackgroundShellManager.get_available_ids() == []
+    for shell in shells:
+        assert shell.status == "terminated"
+        await _assert_group_stopped(shell.process.pid)
+    print("All background shells terminated")
+
+
 @pytest.mark.asyncio
 async def test_bash_kill_nonexistent():
     """Test killing a non-existent bash process."""
@@ -270,3 +394,123 @@ async def test_timeout_validation():
     result = await bash_tool.execute(command="echo 'test'", timeout=0)
     assert result.success
     print("Timeout < 1 handled correctly")
+
+
+def test_split_simple_command():
+    """Test which commands bypass the shell wrapper."""
+    print("\n=== Testing Simple Command Detection ===")
+
+    # Plain commands are executed directly
+    assert _split_simple_command("ls -la /tmp") == ["ls", "-la", "/tmp"]
+    assert _split_simple_command("python3 -m pytest --tb=short") == ["python3", "-m", "pytest", "--tb=short"]
+
+    # Anything relying on shell syntax or builtins goes through the shell
+    assert _split_simple_command("echo 'quoted'") is None
+    assert _split_simple_command("ls | wc -l") is None
+    assert _split_simple_command("echo $HOME") is None
+    assert _split_simple_command("ls *.py") is None
+    assert _split_simple_command("cd /tmp") is None
+    assert _split_simple_command("FOO=bar env") is None
+    assert _split_simple_command("./run.sh") is None
+    assert _split_simple_command("nonexistent_program_12345 --help") is None
+    assert _split_simple_command("") is None
+    print("Simple command detection works correctly")
+
+
+@pytest.mark.asyncio
+async def test_builtin_command_uses_shell(tmp_path):
+    """Test that shell builtins still work when chained."""
+    print("\n=== Testing Shell Builtins ===")
+
+    bash_tool = BashTool()
+    result = await bash_tool.execute(command=f"cd {tmp_path} && pwd")
+
+    assert result.success
+    assert str(tmp_path) in result.stdout
+    print(f"Output: {result.stdout}")
+
+
+@pytest.mark.asyncio
+async def test_output_cap_kills_command(monkeypatch):
+    """Test that runaway output is capped and the command killed."""
+    print("\n=== Testing Output Cap ===")
+
+    monkeypatch.setattr(bash_tool_module, "_MAX_OUTPUT_BYTES", 4096)
+
+    bash_tool = BashTool()
+    result = await bash_tool.execute(command="yes needle", timeout=10)
+
+    assert not result.success
+    assert "exceeded" in result.error
+    assert len(result.stdout.encode()) <= 4096
+    assert result.stdout.startswith("needle\n")
+    print(f"Error: {result.error}")
+
+
+@pytest.mark.asyncio
+async def test_output_cap_kills_pipeline(spawn_mode, monkeypatch):
+    """Test that the output cap stops a whole pipeline, not just the shell."""
+    print("\n=== Testing Output Cap Through Pipeline ===")
+
+    monkeypatch.setattr(bash_tool_module, "_MAX_OUTPUT_BYTES", 4096)
+
+    bash_tool = BashTool()
+    start = time.monotonic()
+    result = await bash_tool.execute(command="yes needle | head -c 20000000", timeout=30)
+
+    assert not result.success
+    assert "exceeded" in result.error
+    assert len(result.stdout.encode()) == 4096
+    assert time.monotonic() - start < 10
+    print(f"Error: {result.error}")
+
+
+@pytest.mark.asyncio
+async def test_timeout_keeps_captured_output(spawn_mode):
+    """Test that output printed before a timeout is returned."""
+    print("\n=== Testing Timeout Keeps Output ===")
+
+    bash_tool = BashTool()
+    result = await bash_tool.execute(command="echo started; echo warming >&2; sleep 30 | sleep 30", timeout=1)
+
+    assert not result.success
+    assert "timed out" in result.error.lower()
+    assert result.stdout == "started\n"
+    assert result.stderr == "warming\n"
+    print(f"Captured before timeout: {result.stdout!r}")
+
+
+@pytest.mark.asyncio
+async def test_timeout_with_escaped_pipe_holder(spawn_mode):
+    """Test that a timeout returns promptly even if a process outside the group holds the pipes."""
+    print("\n=== Testing Timeout With Escaped Pipe Holder ===")
+
+    bash_tool = BashTool()
+    start = time.monotonic()
+    result = await bash_tool.execute(command="setsid sleep 8 & echo hi; sleep 30", timeout=1)
+
+    assert not result.success
+    assert "timed out" in result.error.lower()
+    assert result.stdout == "hi\n"
+    assert time.monotonic() - start < 5
+    print(f"Returned after {time.monotonic() - start:.1f}s")
+
+
+def test_background_output_is_bounded(monkeypatch):
+    """Test that background output keeps only the most recent lines."""
+    print("\n=== Testing Bounded Background Output ===")
+
+    monkeypatch.setattr(bash_tool_module, "_MAX_BACKGROUND_LINES", 3)
+    shell = BackgroundShell(bash_id="test", command="noop", process=None, start_time=0.0)
+
+    shell.add_output("a")
+    assert shell.get_new_output() == ["a"]
+
+    for line in ["b", "c", "d", "e", "f"]:
+        shell.add_output(line)
+    assert shell.get_new_output() == ["[... 2 earlier lines discarded ...]", "d", "e", "f"]
+    assert shell.get_new_output() == []
+
+    shell.add_output("g")
+    assert shell.get_new_output() == ["g"]
+    print("Background output buffer is bounded")
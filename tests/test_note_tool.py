@@ -5,7 +5,7 @@ from pathlib import Path
 
 import pytest
 
-from mini_agent.tools.note_tool import RecallNoteTool, SessionNoteTool
+from mini_agent.tools.note_tool import RecallNoteTool, SessionNoteTool, _parse_notes
 
 
 @pytest.mark.asyncio
@@ -113,6 +113,38 @@ async def test_note_persistence():
         Path(note_file).unlink(missing_ok=True)
 
 
+@pytest.mark.asyncio
+async def test_note_parse_cache():
+    """Test that unchanged note files are not re-parsed."""
+    print("\n=== Testing Note Parse Cache ===")
+
+    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".json") as f:
+        note_file = f.name
+
+    try:
+        record_tool = SessionNoteTool(memory_file=note_file)
+        recall_tool = RecallNoteTool(memory_file=note_file)
+
+        await record_tool.execute(content="First note")
+        _parse_notes.cache_clear()
+
+        # Repeated recalls of an unchanged file reuse the parsed notes
+        await recall_tool.execute()
+        await recall_tool.execute()
+        assert _parse_notes.cache_info().hits >= 1
+
+        # A new note changes the file and invalidates the cached parse
+        await record_tool.execute(content="Second note")
+        result = await recall_tool.execute()
+        assert "First note" in result.content
+        assert "Second note" in result.content
+
+        print("✅ Note parse cache test passed")
+
+    finally:
+        Path(note_file).unlink(missing_ok=True)
+
+
 async def main():
     """Run all session note tool tests."""
     print("=" * 80)
@@ -122,6 +154,7 @@ async def main():
     await test_record_and_recall_notes()
     await test_empty_notes()
     await test_note_persistence()
+    await test_note_parse_cache()
 
     print("\n" + "=" * 80)
     print("All Session Note Tool tests passed! ✅")
@@ -0,0 +1,107 @@
+"""Test cases for the retry mechanism."""
+
+import pytest
+
+from mini_agent import retry
+from mini_agent.retry import RetryConfig, RetryExhaustedError, async_retry, is_retryable_error
+
+
+class FakeAPIError(Exception):
+    """API error carrying an HTTP status code, like the SDK exceptions."""
+
+    def __init__(self, status_code: int):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+def test_is_retryable_error():
+    """Test classification of transient and permanent errors."""
+    print("\n=== Testing Retryable Error Classification ===")
+
+    assert is_retryable_error(TimeoutError())
+    assert is_retryable_error(ConnectionError())
+    assert is_retryable_error(FakeAPIError(500))
+    assert is_retryable_error(FakeAPIError(429))
+    assert not is_retryable_error(FakeAPIError(400))
+    assert not is_retryable_error(FakeAPIError(401))
+    print("✅ Retryable error classification test passed")
+
+
+@pytest.mark.asyncio
+async def test_retry_transient_error():
+    """Test that transient errors are retried until exhausted."""
+    print("\n=== Testing Transient Error Retry ===")
+
+    calls = 0
+
+    @async_retry(RetryConfig(max_retries=2, initial_delay=0))
+    async def flaky():
+        nonlocal calls
+        calls += 1
+        raise FakeAPIError(503)
+
+    with pytest.raises(RetryExhaustedError) as exc_info:
+        await flaky()
+    assert calls == 3
+    assert exc_info.value.attempts == 3
+    print("✅ Transient error retry test passed")
+
+
+@pytest.mark.asyncio
+async def test_no_retry_on_permanent_error():
+    """Test that permanent API errors are raised without retrying."""
+    print("\n=== Testing Permanent Error ===")
+
+    calls = 0
+
+    @async_retry(RetryConfig(max_retries=3, initial_delay=0))
+    async def unauthorized():
+        nonlocal calls
+        calls += 1
+        raise FakeAPIError(401)
+
+    with pytest.raises(FakeAPIError):
+        await unauthorized()
+    assert calls == 1
+    print("✅ Permanent error test passed")
+
+
+@pytest.mark.asyncio
+async def test_retry_delay_jitter(monkeypatch):
+    """Test that backoff delays get bounded random jitter."""
+    print("\n=== Testing Retry Jitter ===")
+
+    delays = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(retry.asyncio, "sleep", fake_sleep)
+    config = RetryConfig(max_retries=3, initial_delay=1.0, exponential_base=2.0, jitter=0.5)
+
+    @async_retry(config)
+    async def failing():
+        raise TimeoutError()
+
+    with pytest.raises(RetryExhaustedError):
+        await failing()
+
+    assert len(delays) == 3
+    for attempt, delay in enumerate(delays):
+        base = config.calculate_delay(attempt)
+        assert base <= delay <= base * 1.5
+    print(f"Delays: {delays}")
+
+    # Jitter never pushes a delay past max_delay
+    delays.clear()
+    config = RetryConfig(max_retries=3, initial_delay=1.0, max_delay=2.0, exponential_base=2.0, jitter=0.5)
+
+    @async_retry(config)
+    async def failing_capped():
+        raise TimeoutError()
+
+    with pytest.raises(RetryExhaustedError):
+        await failing_capped()
+
+    assert delays[1:] == [2.0, 2.0]
+    print("✅ Retry jitter test passed")
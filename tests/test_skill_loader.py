@@ -2,11 +2,14 @@
 Test Skill Loader
 """
 
+import json
 import tempfile
 from pathlib import Path
+from unittest.mock import Mock
 
 import pytest
 
+from mini_agent.tools import skill_loader as skill_loader_module
 from mini_agent.tools.skill_loader import Skill, SkillLoader
 
 
@@ -112,6 +115,85 @@ def test_discover_skills():
         assert len(loader.list_skills()) == 3
 
 
+def test_discover_skills_uses_parse_cache(monkeypatch):
+    """Test that parsed frontmatter is persisted and reused until SKILL.md changes"""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        skills_dir = Path(tmpdir) / "skills"
+        skill_dir = skills_dir / "cached-skill"
+        skill_dir.mkdir(parents=True)
+        create_test_skill(skill_dir, "cached-skill", "Cached", "Original content")
+        cache_file = Path(tmpdir) / "cache" / "skills.json"
+
+        SkillLoader(str(skills_dir), cache_file=str(cache_file)).discover_skills()
+        assert cache_file.exists()
+
+        # A fresh loader must not need to parse YAML for the unchanged skill
+        def fail_load(*args, **kwargs):
+            raise AssertionError("frontmatter should come from the cache")
+
+        monkeypatch.setattr(skill_loader_module.yaml, "load", fail_load)
+        loader = SkillLoader(str(skills_dir), cache_file=str(cache_file))
+        skills = loader.discover_skills()
+        assert [s.name for s in skills] == ["cached-skill"]
+        assert "Original content" in skills[0].content
+
+        # Changing the file invalidates its entry
+        monkeypatch.undo()
+        create_test_skill(skill_dir, "cached-skill", "Cached", "Updated content, longer than before")
+        skills = SkillLoader(str(skills_dir), cache_file=str(cache_file)).discover_skills()
+        assert "Updated content" in skills[0].content
+
+
+def test_parse_cache_prunes_removed_skills():
+    """Test that removed skills leave the cache, while other skills directories keep their entries"""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cache_file = Path(tmpdir) / "skills.json"
+        other_dir = Path(tmpdir) / "other"
+        (other_dir / "kept-skill").mkdir(parents=True)
+        create_test_skill(other_dir / "kept-skill", "kept-skill", "Kept", "Kept content")
+        SkillLoader(str(other_dir), cache_file=str(cache_file)).discover_skills()
+
+        skills_dir = Path(tmpdir) / "skills"
+        for name in ["skill-a", "skill-b"]:
+            (skills_dir / name).mkdir(parents=True)
+            create_test_skill(skills_dir / name, name, f"Skill {name}", "Content")
+        SkillLoader(str(skills_dir), cache_file=str(cache_file)).discover_skills()
+        assert len(json.loads(cache_file.read_text())["entries"]) == 3
+
+        (skills_dir / "skill-b" / "SKILL.md").unlink()
+        SkillLoader(str(skills_dir), cache_file=str(cache_file)).discover_skills()
+
+        entries = json.loads(cache_file.read_text())["entries"]
+        assert sorted(Path(key).parent.name for key in entries) == ["kept-skill", "skill-a"]
+
+
+def test_skill_content_loaded_lazily():
+    """Test that skill bodies are only read when content is accessed"""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        skill_dir = Path(tmpdir) / "lazy-skill"
+        skill_dir.mkdir()
+        create_test_skill(skill_dir, "lazy-skill", "Lazy", "Body text")
+
+        loader = SkillLoader(tmpdir)
+        skill = loader.load_skill(skill_dir / "SKILL.md")
+
+        assert skill is not None
+        skill.content_loader = Mock(wraps=skill.content_loader)
+        assert skill.name == "lazy-skill"
+        skill.content_loader.assert_not_called()
+
+        assert skill.content == "Body text"
+        assert skill.content == "Body text"
+        skill.content_loader.assert_called_once()
+
+        # Explicit content still works as before, positionally or by keyword
+        assert Skill("inline", "Inline", "Inline body").content == "Inline body"
+        inline = Skill(name="inline", description="Inline")
+        assert inline.content is None
+        inline.content = "Inline body"
+        assert inline == Skill(name="inline", description="Inline", content="Inline body")
+
+
 def test_get_skill():
     """Test getting a loaded skill"""
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -72,6 +72,24 @@ async def test_get_skill_tool_nonexistent(skill_loader):
     assert "不存在" in result.error or "not exist" in result.error.lower()
 
 
+@pytest.mark.asyncio
+async def test_get_skill_tool_unreadable_skill(skill_loader):
+    """Test that a skill file removed or broken after discovery is reported as a tool error"""
+    tool = GetSkillTool(skill_loader)
+
+    skill_path = skill_loader.get_skill("test-skill-0").skill_path
+    skill_path.unlink()
+    result = await tool.execute(skill_name="test-skill-0")
+    assert not result.success
+    assert "test-skill-0" in result.error
+
+    skill_path = skill_loader.get_skill("test-skill-1").skill_path
+    skill_path.write_text("No frontmatter anymore", encoding="utf-8")
+    result = await tool.execute(skill_name="test-skill-1")
+    assert not result.success
+    assert "frontmatter" in result.error
+
+
 def test_create_skill_tools_returns_single_tool(skill_loader):
     """Test that create_skill_tools only returns GetSkillTool after optimization"""
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -242,6 +242,16 @@ def test_tool_schema_consistency():
     assert anthropic_schema["input_schema"] == openai_schema["function"]["parameters"]
 
 
+def test_tool_schema_is_cached():
+    """Test that schemas are built once per tool instance."""
+    tool = MockSearchTool()
+
+    assert tool.to_schema() is tool.to_schema()
+    assert tool.to_openai_schema() is tool.to_openai_schema()
+    # Separate instances get their own schema
+    assert MockSearchTool().to_schema() is not tool.to_schema()
+
+
 @pytest.mark.asyncio
 async def test_tool_execute():
     """Test that tools can be executed."""
@@ -1,12 +1,13 @@
 """Test cases for tools."""
 
 import asyncio
+import os
 import tempfile
 from pathlib import Path
 
 import pytest
 
-from mini_agent.tools import BashTool, EditTool, ReadTool, WriteTool
+from mini_agent.tools import BashTool, EditTool, ReadTool, WriteTool, file_tools
 
 
 @pytest.mark.asyncio
@@ -32,6 +33,43 @@ async def test_read_tool():
         Path(temp_path).unlink()
 
 
+@pytest.mark.asyncio
+async def test_read_cache_sees_changes(tmp_path):
+    """Test cached file reads are invalidated when the file changes."""
+    print("\n=== Testing Read Cache Invalidation ===")
+
+    file_path = tmp_path / "notes.txt"
+    file_path.write_text("first\n", encoding="utf-8")
+    assert file_tools._read_lines(file_path) == ("first\n",)
+    assert file_tools._read_lines(file_path) is file_tools._read_lines(file_path)
+
+    await WriteTool().execute(path=str(file_path), content="second\n")
+    assert file_tools._read_lines(file_path) == ("second\n",)
+
+    await EditTool().execute(path=str(file_path), old_str="second", new_str="third")
+    assert file_tools._read_lines(file_path) == ("third\n",)
+    print("✅ Read cache invalidation test passed")
+
+
+def test_read_cache_skips_large_files(tmp_path, monkeypatch):
+    """Test files above the cache size limit are not kept in the read cache."""
+    print("\n=== Testing Read Cache Size Limit ===")
+
+    monkeypatch.setattr(file_tools, "_READ_CACHE_MAX_BYTES", 16)
+    small_path = tmp_path / "small.txt"
+    small_path.write_text("short\n", encoding="utf-8")
+    large_path = tmp_path / "large.txt"
+    large_path.write_text("x" * 64 + "\n", encoding="utf-8")
+
+    assert file_tools._read_lines(small_path) is file_tools._read_lines(small_path)
+
+    cache_size = file_tools._cached_lines.cache_info().currsize
+    assert file_tools._read_lines(large_path) == ("x" * 64 + "\n",)
+    assert file_tools._read_lines(large_path) is not file_tools._read_lines(large_path)
+    assert file_tools._cached_lines.cache_info().currsize == cache_size
+    print("✅ Read cache size limit test passed")
+
+
 @pytest.mark.asyncio
 async def test_write_tool():
     """Test write file tool."""
@@ -49,6 +87,70 @@ async def test_write_tool():
         print("✅ WriteTool test passed")
 
 
+@pytest.mark.asyncio
+async def test_write_tool_atomic_overwrite(tmp_path):
+    """Test write tool replaces existing files atomically."""
+    print("\n=== Testing WriteTool Atomic Overwrite ===")
+
+    file_path = tmp_path / "script.sh"
+    file_path.write_text("old content", encoding="utf-8")
+    file_path.chmod(0o755)
+
+    tool = WriteTool()
+    result = await tool.execute(path=str(file_path), content="new content")
+
+    assert result.success, f"Write failed: {result.error}"
+    assert file_path.read_text(encoding="utf-8") == "new content"
+    assert file_path.stat().st_mode & 0o777 == 0o755
+    assert [p.name for p in tmp_path.iterdir()] == ["script.sh"]
+    print("✅ WriteTool atomic overwrite test passed")
+
+
+@pytest.mark.asyncio
+async def test_write_tool_new_file_respects_umask(tmp_path):
+    """Test write tool creates new files with the process umask applied."""
+    print("\n=== Testing WriteTool New File Mode ===")
+
+    old_umask = os.umask(0o027)
+    try:
+        result = await WriteTool().execute(path=str(tmp_path / "new.txt"), content="hello")
+    finally:
+        os.umask(old_umask)
+
+    assert result.success, f"Write failed: {result.error}"
+    assert (tmp_path / "new.txt").stat().st_mode & 0o777 == 0o640
+    assert [p.name for p in tmp_path.iterdir()] == ["new.txt"]
+    print("✅ WriteTool new file mode test passed")
+
+
+@pytest.mark.asyncio
+async def test_write_tool_preserves_file_identity(tmp_path):
+    """Test write tool refuses read-only files and keeps hard links intact."""
+    print("\n=== Testing WriteTool File Identity ===")
+
+    file_path = tmp_path / "linked.txt"
+    file_path.write_text("old content")
+    link_path = tmp_path / "link.txt"
+    os.link(file_path, link_path)
+
+    result = await WriteTool().execute(path=str(file_path), content="new content")
+    assert result.success, f"Write failed: {result.error}"
+    assert link_path.read_text() == "new content"
+    assert file_path.stat().st_ino == link_path.stat().st_ino
+    print("✅ WriteTool hard link test passed")
+
+    if os.geteuid() == 0:
+        pytest.skip("root can write read-only files")
+    readonly = tmp_path / "readonly.txt"
+    readonly.write_text("old content")
+    readonly.chmod(0o444)
+    result = await WriteTool().execute(path=str(readonly), content="new content")
+    assert not result.success
+    assert "permission denied" in result.error.lower()
+    assert readonly.read_text() == "old content"
+    print("✅ WriteTool read-only test passed")
+
+
 @pytest.mark.asyncio
 async def test_edit_tool():
     """Test edit file tool."""
@@ -72,6 +174,88 @@ async def test_edit_tool():
         Path(temp_path).unlink()
 
 
+@pytest.mark.asyncio
+async def test_edit_tool_streaming(tmp_path, monkeypatch):
+    """Test edit tool on matches spanning chunk boundaries."""
+    print("\n=== Testing EditTool Streaming ===")
+
+    # Tiny chunks force matches to straddle chunk boundaries
+    monkeypatch.setattr(file_tools, "_EDIT_CHUNK_SIZE", 7)
+
+    file_path = tmp_path / "big.txt"
+    original = "".join(f"line {i}: needle here\n" for i in range(50))
+    file_path.write_text(original, encoding="utf-8")
+
+    tool = EditTool()
+    result = await tool.execute(path=str(file_path), old_str="needle", new_str="pin")
+    assert result.success, f"Edit failed: {result.error}"
+    assert file_path.read_text(encoding="utf-8") == original.replace("needle", "pin")
+
+    # Missing text leaves the file untouched and no temp files behind
+    result = await tool.execute(path=str(file_path), old_str="haystack", new_str="x")
+    assert not result.success
+    assert "not found" in result.error.lower()
+    assert [p.name for p in tmp_path.iterdir()] == ["big.txt"]
+    print("✅ EditTool streaming test passed")
+
+
+@pytest.mark.asyncio
+async def test_edit_tool_crlf(tmp_path):
+    """Test edit tool keeps CRLF line endings."""
+    print("\n=== Testing EditTool CRLF ===")
+
+    file_path = tmp_path / "windows.txt"
+    file_path.write_bytes(b"first\r\nsecond\r\nthird\r\n")
+
+    tool = EditTool()
+    result = await tool.execute(path=str(file_path), old_str="first\nsecond", new_str="one\ntwo")
+    assert result.success, f"Edit failed: {result.error}"
+    assert file_path.read_bytes() == b"one\r\ntwo\r\nthird\r\n"
+    print("✅ EditTool CRLF test passed")
+
+    # Mixed line endings: an exact "\n" match wins over the CRLF fallback
+    file_path.write_bytes(b"header\r\nb\nc\n")
+    result = await tool.execute(path=str(file_path), old_str="b\nc", new_str="x\ny")
+    assert result.success, f"Edit failed: {result.error}"
+    assert file_path.read_bytes() == b"header\r\nx\ny\n"
+
+    # CRLF lines far past the first chunk are still found
+    file_path.write_bytes(b"a\n" * 600_000 + b"first\r\nsecond\r\n")
+    result = await tool.execute(path=str(file_path), old_str="first\nsecond", new_str="done")
+    assert result.success, f"Edit failed: {result.error}"
+    assert file_path.read_bytes().endswith(b"a\ndone\r\n")
+    print("✅ EditTool mixed line endings test passed")
+
+
+@pytest.mark.asyncio
+async def test_edit_tool_preserves_file_identity(tmp_path):
+    """Test edit tool refuses read-only files and keeps hard links intact."""
+    print("\n=== Testing EditTool File Identity ===")
+
+    tool = EditTool()
+    file_path = tmp_path / "linked.txt"
+    file_path.write_text("old value\n")
+    link_path = tmp_path / "link.txt"
+    os.link(file_path, link_path)
+
+    result = await tool.execute(path=str(file_path), old_str="old", new_str="new")
+    assert result.success, f"Edit failed: {result.error}"
+    assert link_path.read_text() == "new value\n"
+    assert file_path.stat().st_ino == link_path.stat().st_ino
+    print("✅ EditTool hard link test passed")
+
+    if os.geteuid() == 0:
+        pytest.skip("root can write read-only files")
+    readonly = tmp_path / "readonly.txt"
+    readonly.write_text("old value\n")
+    readonly.chmod(0o444)
+    result = await tool.execute(path=str(readonly), old_str="old", new_str="new")
+    assert not result.success
+    assert "permission denied" in result.error.lower()
+    assert readonly.read_text() == "old value\n"
+    print("✅ EditTool read-only test passed")
+
+
 @pytest.mark.asyncio
 async def test_bash_tool():
     """Test bash command tool."""
@@ -0,0 +1,32 @@
+"""Tests for yaml_utils module."""
+
+import io
+
+import pytest
+import yaml
+
+from mini_agent.utils import safe_load_yaml
+
+
+class TestSafeLoadYaml:
+    """Tests for safe_load_yaml function."""
+
+    def test_matches_safe_load(self):
+        """Test parsing matches yaml.safe_load for text and streams."""
+        text = "api_key: abc\nretry:\n  enabled: true\n  max_retries: 3\ntools: [a, b]\n"
+        assert safe_load_yaml(text) == yaml.safe_load(text)
+        assert safe_load_yaml(io.StringIO(text)) == yaml.safe_load(text)
+
+    def test_empty_document(self):
+        """Test empty input parses to None."""
+        assert safe_load_yaml("") is None
+
+    def test_rejects_unsafe_tags(self):
+        """Test arbitrary Python object tags are refused."""
+        with pytest.raises(yaml.YAMLError):
+            safe_load_yaml("!!python/object/apply:os.system ['echo unsafe']")
+
+    def test_invalid_yaml(self):
+        """Test malformed YAML raises YAMLError."""
+        with pytest.raises(yaml.YAMLError):
+            safe_load_yaml("key: [unclosed")